@@ -8,6 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 
 import pandas as pd
+import typer
 
 from src.aliases import AliasDatabase
 from src.matcher import calculate_confidence, create_manual_match, find_matches
@@ -16,40 +17,41 @@ from src.models import MatchConfig
 
 def demo_merchant_aliases():
     """Demonstrate merchant alias system."""
-    print("\n" + "=" * 60)
-    print("DEMO 1: Merchant Alias System")
-    print("=" * 60)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DEMO 1: Merchant Alias System")
+    lines.append("=" * 60)
 
     # Create database
     db = AliasDatabase("demo_aliases.db")
 
     # Add aliases
-    print("\n📝 Adding aliases...")
+    lines.append("\n📝 Adding aliases...")
     db.add_alias("Netflix", "netflix.com")
     db.add_alias("Netflix", "netflix")
     db.add_alias("AT&T", "att payment")
-    print("  ✓ Netflix → netflix.com")
-    print("  ✓ Netflix → netflix")
-    print("  ✓ AT&T → att payment")
+    lines.append("  ✓ Netflix → netflix.com")
+    lines.append("  ✓ Netflix → netflix")
+    lines.append("  ✓ AT&T → att payment")
 
     # List aliases
-    print("\n📋 All aliases (sorted by usage):")
+    lines.append("\n📋 All aliases (sorted by usage):")
     aliases = db.list_aliases()
     for alias in aliases:
-        print(f"  - '{alias.alias}' → '{alias.primary_name}' (used {alias.usage_count}x)")
+        lines.append(f"  - '{alias.alias}' → '{alias.primary_name}' (used {alias.usage_count}x)")
 
     # Lookup
-    print("\n🔍 Looking up 'netflix.com'...")
+    lines.append("\n🔍 Looking up 'netflix.com'...")
     primary = db.get_primary_name("netflix.com")
-    print(f"  → Primary name: {primary}")
+    lines.append(f"  → Primary name: {primary}")
 
     # Similarity search
-    print("\n🎯 Finding aliases similar to 'netlix'...")
+    lines.append("\n🎯 Finding aliases similar to 'netlix'...")
     similar = db.find_similar_aliases("netlix", threshold=0.7)
-    print(f"  → Found: {similar}")
+    lines.append(f"  → Found: {similar}")
 
     # Integration test
-    print("\n🔗 Testing integration with matcher...")
+    lines.append("\n🔗 Testing integration with matcher...")
 
     source = pd.Series(
         {
@@ -70,24 +72,26 @@ def demo_merchant_aliases():
 
     # Without alias
     confidence_without = calculate_confidence(source, target, config, alias_db=None)
-    print(f"  Confidence WITHOUT alias: {confidence_without:.2f}")
+    lines.append(f"  Confidence WITHOUT alias: {confidence_without:.2f}")
 
     # With alias
     confidence_with = calculate_confidence(source, target, config, alias_db=db)
-    print(f"  Confidence WITH alias:    {confidence_with:.2f}")
+    lines.append(f"  Confidence WITH alias:    {confidence_with:.2f}")
 
     boost = confidence_with - confidence_without
-    print(f"  ✨ Confidence boost:       +{boost:.2%}")
+    lines.append(f"  ✨ Confidence boost:       +{boost:.2%}")
 
     db.close()
-    print("\n✅ Merchant Alias System demo complete!")
+    lines.append("\n✅ Merchant Alias System demo complete!")
+    typer.echo("\n".join(lines))
 
 
 def demo_manual_matching():
     """Demonstrate manual matching."""
-    print("\n" + "=" * 60)
-    print("DEMO 2: Manual Matching")
-    print("=" * 60)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DEMO 2: Manual Matching")
+    lines.append("=" * 60)
 
     # Create test data
     source_df = pd.DataFrame(
@@ -115,31 +119,31 @@ def demo_manual_matching():
         ]
     )
 
-    print("\n📊 Test Data:")
-    print(f"  Source records: {len(source_df)}")
-    print(f"  Target records: {len(target_df)}")
+    lines.append("\n📊 Test Data:")
+    lines.append(f"  Source records: {len(source_df)}")
+    lines.append(f"  Target records: {len(target_df)}")
 
     # Auto-match
-    print("\n🤖 Auto-matching...")
+    lines.append("\n🤖 Auto-matching...")
     config = MatchConfig(threshold=0.7)
     result = find_matches(source_df, target_df, config)
 
-    print(f"  Found {len(result.matches)} matches")
-    print(f"  Missing: {result.missing_in_target}")
+    lines.append(f"  Found {len(result.matches)} matches")
+    lines.append(f"  Missing: {result.missing_in_target}")
 
     if result.matches:
         match = result.matches[0]
-        print("\n  Match:")
-        print(f"    Source: {source_df.at[match.source_idx, 'description_clean']}")
+        lines.append("\n  Match:")
+        lines.append(f"    Source: {source_df.at[match.source_idx, 'description_clean']}")
         assert match.target_idx is not None
-        print(f"    Target: {target_df.at[match.target_idx, 'description_clean']}")
-        print(f"    Confidence: {match.confidence:.2f}")
-        print(f"    Reason: {match.reason}")
-        print(f"    Manual: {match.manual}")
+        lines.append(f"    Target: {target_df.at[match.target_idx, 'description_clean']}")
+        lines.append(f"    Confidence: {match.confidence:.2f}")
+        lines.append(f"    Reason: {match.reason}")
+        lines.append(f"    Manual: {match.manual}")
 
     # Manual match for missing record
     if result.missing_in_target:
-        print(f"\n✋ Manual matching for source #{result.missing_in_target[0]}...")
+        lines.append(f"\n✋ Manual matching for source #{result.missing_in_target[0]}...")
         manual_match = create_manual_match(
             result.missing_in_target[0],
             0,
@@ -147,22 +151,24 @@ def demo_manual_matching():
             target_df,
         )
 
-        print("  Created manual match:")
-        print(f"    Source: {source_df.at[manual_match.source_idx, 'description_clean']}")
+        lines.append("  Created manual match:")
+        lines.append(f"    Source: {source_df.at[manual_match.source_idx, 'description_clean']}")
         assert manual_match.target_idx is not None
-        print(f"    Target: {target_df.at[manual_match.target_idx, 'description_clean']}")
-        print(f"    Confidence: {manual_match.confidence:.2f}")
-        print(f"    Reason: {manual_match.reason}")
-        print(f"    Manual: {manual_match.manual}")
+        lines.append(f"    Target: {target_df.at[manual_match.target_idx, 'description_clean']}")
+        lines.append(f"    Confidence: {manual_match.confidence:.2f}")
+        lines.append(f"    Reason: {manual_match.reason}")
+        lines.append(f"    Manual: {manual_match.manual}")
 
-    print("\n✅ Manual Matching demo complete!")
+    lines.append("\n✅ Manual Matching demo complete!")
+    typer.echo("\n".join(lines))
 
 
 def demo_edit_records():
     """Demonstrate record editing."""
-    print("\n" + "=" * 60)
-    print("DEMO 3: Edit Records")
-    print("=" * 60)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DEMO 3: Edit Records")
+    lines.append("=" * 60)
 
     # Create test data
     source_df = pd.DataFrame(
@@ -175,15 +181,15 @@ def demo_edit_records():
         ]
     )
 
-    print("\n📝 Original record:")
-    print(f"  Description: '{source_df.iloc[0]['description_clean']}'")
+    lines.append("\n📝 Original record:")
+    lines.append(f"  Description: '{source_df.iloc[0]['description_clean']}'")
 
     # Simulate editing
-    print("\n✏️  Editing description...")
+    lines.append("\n✏️  Editing description...")
     new_description = "Netflix Subscription"
     source_df.at[0, "description_clean"] = new_description
 
-    print(f"  New description: '{source_df.iloc[0]['description_clean']}'")
+    lines.append(f"  New description: '{source_df.iloc[0]['description_clean']}'")
 
     # Show confidence impact
     target_df = pd.DataFrame(
@@ -198,7 +204,7 @@ def demo_edit_records():
 
     config = MatchConfig()
 
-    print("\n🔗 Confidence impact:")
+    lines.append("\n🔗 Confidence impact:")
 
     # Before edit
     source_df.at[0, "description_clean"] = "netflix.com"
@@ -207,7 +213,7 @@ def demo_edit_records():
         target_df.iloc[0],
         config,
     )
-    print(f"  Before edit: {confidence_before:.2f}")
+    lines.append(f"  Before edit: {confidence_before:.2f}")
 
     # After edit
     source_df.at[0, "description_clean"] = "Netflix Subscription"
@@ -216,38 +222,45 @@ def demo_edit_records():
         target_df.iloc[0],
         config,
     )
-    print(f"  After edit:  {confidence_after:.2f}")
+    lines.append(f"  After edit:  {confidence_after:.2f}")
 
-    print("\n✅ Edit Records demo complete!")
+    lines.append("\n✅ Edit Records demo complete!")
+    typer.echo("\n".join(lines))
 
 
 def main():
     """Run all demos."""
-    print("\n" + "=" * 60)
-    print("DOUBLE POST - FEATURE DEMONSTRATION")
-    print("Testing Manual Matching, Edit Records, and Merchant Aliases")
-    print("=" * 60)
+    banner = [
+        "\n" + "=" * 60,
+        "DOUBLE POST - FEATURE DEMONSTRATION",
+        "Testing Manual Matching, Edit Records, and Merchant Aliases",
+        "=" * 60,
+    ]
+    typer.echo("\n".join(banner))
 
     try:
         demo_merchant_aliases()
         demo_manual_matching()
         demo_edit_records()
 
-        print("\n" + "=" * 60)
-        print("✅ ALL DEMOS COMPLETE!")
-        print("=" * 60)
-        print("\n💡 Next steps:")
-        print("  1. Run: uv run python -m src.main <source> <target>")
-        print("  2. Test the features interactively in the TUI")
-        print("  3. Try the keyboard shortcuts:")
-        print("     - m: Manual match")
-        print("     - e/E: Edit source/target")
-        print("     - a: Accept match")
-        print("     - r: Reject match")
-        print("=" * 60)
+        summary = [
+            "\n" + "=" * 60,
+            "✅ ALL DEMOS COMPLETE!",
+            "=" * 60,
+            "\n💡 Next steps:",
+            "  1. Run: uv run python -m src.main <source> <target>",
+            "  2. Test the features interactively in the TUI",
+            "  3. Try the keyboard shortcuts:",
+            "     - m: Manual match",
+            "     - e/E: Edit source/target",
+            "     - a: Accept match",
+            "     - r: Reject match",
+            "=" * 60,
+        ]
+        typer.echo("\n".join(summary))
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        typer.echo(f"\n❌ Error: {e}", err=True)
         import traceback
 
         traceback.print_exc()
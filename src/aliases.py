@@ -4,11 +4,17 @@ Stores and manages merchant name aliases to improve matching confidence.
 """
 
 import sqlite3
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 
 @dataclass
@@ -18,7 +24,7 @@ class MerchantAlias:
     Attributes:
         primary_name: The canonical merchant name
         alias: An alternative name that maps to the primary
-        created_at: When this alias was created
+        created_at: When this alias was created (UTC, set by SQLite)
         usage_count: How many times this alias has been looked up
     """
 
@@ -28,12 +34,72 @@ class MerchantAlias:
     usage_count: int
 
 
+_CREATE_ALIASES_TABLE = """
+    CREATE TABLE IF NOT EXISTS aliases (
+        alias TEXT PRIMARY KEY,
+        primary_name TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        usage_count INTEGER DEFAULT 0
+    ) WITHOUT ROWID
+"""
+
+# Insert, or update the primary name if the alias already exists
+_UPSERT_ALIAS = """
+    INSERT INTO aliases (primary_name, alias) VALUES (?, ?)
+    ON CONFLICT(alias) DO UPDATE SET primary_name = excluded.primary_name
+"""
+
+
+@dataclass
+class _AliasIndex:
+    """In-memory copy of the alias table, shared by instances opened on one file.
+
+    Attributes:
+        primary_by_alias: Normalized alias -> primary name
+        version: Bumped on every write; keys the similarity-search cache
+    """
+
+    primary_by_alias: dict[str, str] = field(default_factory=dict)
+    version: int = 0
+
+
+@dataclass
+class _SharedConnection:
+    """SQLite connection and alias index shared by instances opened on one file.
+
+    Attributes:
+        conn: Open connection, configured and with the schema in place
+        index: In-memory copy of the alias table
+        refs: Number of open AliasDatabase instances using this entry
+    """
+
+    conn: sqlite3.Connection
+    index: _AliasIndex
+    refs: int = 0
+
+
 class AliasDatabase:
     """SQLite database for storing and managing merchant aliases.
 
     Provides CRUD operations for merchant name aliases and similarity search.
+    The alias table is loaded into memory once, so lookups never touch SQLite;
+    writes go to both. Usage counts are accumulated in memory and written back
+    in one batch (see ``_flush_usage``).
+
+    Instances opened on the same file share one connection and one in-memory
+    index; the connection is closed when the last of them is closed (or by
+    ``close_all``). ``:memory:`` databases are private to their instance and
+    never pooled. Pooled connections may be used from other threads (e.g.
+    Textual workers), but calls are not serialized between threads.
     """
 
+    # One shared connection per database file, so repeated construction is cheap
+    # and every instance sees the same writes
+    _pool: ClassVar[dict[Path, _SharedConnection]] = {}
+
+    # SQLite path that opens a fresh private database on every connect
+    _MEMORY_PATH: ClassVar[str] = ":memory:"
+
     def __init__(self, db_path: str | Path) -> None:
         """Initialize the alias database.
 
@@ -44,24 +110,90 @@ class AliasDatabase:
             Exception: If database cannot be created/opened
         """
         self.db_path = Path(db_path)
-        self.conn: sqlite3.Connection = sqlite3.connect(self.db_path)
+
+        # Each :memory: connection is its own database, so it is not pooled
+        self._pool_key: Path | None = None
+        if str(db_path) == self._MEMORY_PATH:
+            shared = self._open_shared()
+        else:
+            self._pool_key = self.db_path.resolve()
+            pooled = self._pool.get(self._pool_key)
+            if pooled is None:
+                pooled = self._open_shared()
+                self._pool[self._pool_key] = pooled
+            shared = pooled
+        shared.refs += 1
+
+        self._shared = shared
+        self.conn: sqlite3.Connection = shared.conn
+        self._index = shared.index
+        self._closed = False
+        self._usage_delta: defaultdict[str, int] = defaultdict(int)
+        self._find_similar_cached = lru_cache(maxsize=4096)(self._find_similar_uncached)
+
+    def _open_shared(self) -> _SharedConnection:
+        """Open and configure a new connection for this file and load its index.
+
+        Returns:
+            A _SharedConnection with no references yet
+        """
+        # Autocommit mode: single statements commit themselves, bulk writes
+        # are grouped explicitly with _transaction()
+        # check_same_thread=False lets a pooled connection be reused from worker
+        # threads; the sqlite3 module is built serialized (threadsafety 3)
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
 
+        # WAL + synchronous=NORMAL avoids an fsync of the journal on every commit
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+
         # Create table if not exists
         self._create_table()
 
+        return _SharedConnection(conn=self.conn, index=self._load_index())
+
     def _create_table(self) -> None:
-        """Create the aliases table if it doesn't exist."""
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS aliases (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                primary_name TEXT NOT NULL,
-                alias TEXT NOT NULL UNIQUE,
-                created_at TEXT NOT NULL,
-                usage_count INTEGER DEFAULT 0
+        """Create the aliases table and indexes if they don't exist.
+
+        ``alias`` is the only lookup key, so it is the primary key of a
+        WITHOUT ROWID table, and SQLite fills in ``created_at``. Databases
+        created with an older layout (``id INTEGER PRIMARY KEY AUTOINCREMENT``,
+        or no ``created_at`` default) are migrated in place.
+        """
+        columns = {
+            row["name"]: row["dflt_value"]
+            for row in self._execute_query("PRAGMA table_info(aliases)")
+        }
+        if columns and ("id" in columns or columns.get("created_at") is None):
+            self._migrate_legacy_table()
+        else:
+            self.conn.execute(_CREATE_ALIASES_TABLE)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_usage_desc ON aliases(usage_count DESC)")
+
+    def _migrate_legacy_table(self) -> None:
+        """Copy rows from an older table layout into the current one."""
+        with self._transaction():
+            self.conn.execute("ALTER TABLE aliases RENAME TO aliases_legacy")
+            self.conn.execute(_CREATE_ALIASES_TABLE)
+            self.conn.execute(
+                """INSERT INTO aliases (alias, primary_name, created_at, usage_count)
+                   SELECT alias, primary_name, created_at, usage_count FROM aliases_legacy"""
             )
-        """)
-        self.conn.commit()
+            self.conn.execute("DROP TABLE aliases_legacy")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Group several writes into one explicit transaction (one commit)."""
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def _execute_query(self, query: str, params: tuple = ()) -> list[sqlite3.Row]:
         """Execute a SELECT query and return results.
@@ -76,6 +208,26 @@ class AliasDatabase:
         cursor = self.conn.execute(query, params)
         return cursor.fetchall()
 
+    def _load_index(self) -> _AliasIndex:
+        """Load the alias table into a new in-memory index.
+
+        Returns:
+            _AliasIndex holding every alias -> primary name mapping
+        """
+        rows = self._execute_query("SELECT alias, primary_name FROM aliases")
+        return _AliasIndex(primary_by_alias={row["alias"]: row["primary_name"] for row in rows})
+
+    def _flush_usage(self) -> None:
+        """Write accumulated usage-count increments back in a single batch."""
+        if not self._usage_delta:
+            return
+        with self._transaction():
+            self.conn.executemany(
+                "UPDATE aliases SET usage_count = usage_count + ? WHERE alias = ?",
+                [(count, alias) for alias, count in self._usage_delta.items()],
+            )
+        self._usage_delta.clear()
+
     def add_alias(self, primary_name: str, alias: str) -> None:
         """Add a new alias mapping.
 
@@ -97,28 +249,42 @@ class AliasDatabase:
         if not alias:
             raise ValueError("Alias cannot be empty")
 
-        # Check if alias exists
-        existing = self._execute_query("SELECT primary_name FROM aliases WHERE alias = ?", (alias,))
+        self.conn.execute(_UPSERT_ALIAS, (primary_name, alias))
 
-        if existing:
-            # Update existing alias
-            self.conn.execute(
-                "UPDATE aliases SET primary_name = ? WHERE alias = ?", (primary_name, alias)
-            )
-        else:
-            # Insert new alias
-            self.conn.execute(
-                """INSERT INTO aliases (primary_name, alias, created_at, usage_count)
-                   VALUES (?, ?, ?, 0)""",
-                (primary_name, alias, datetime.now().isoformat()),
-            )
+        self._index.primary_by_alias[alias] = primary_name
+        self._index.version += 1
+
+    def bulk_add_aliases(self, pairs: list[tuple[str, str]]) -> None:
+        """Add many alias mappings in a single transaction.
+
+        Equivalent to calling ``add_alias`` for each pair, but all rows are
+        written with one ``executemany``. Nothing is written if any pair is
+        invalid.
+
+        Args:
+            pairs: (primary_name, alias) tuples
+
+        Raises:
+            ValueError: If any primary_name or alias is empty
+        """
+        rows = [(primary_name.strip(), alias.strip().lower()) for primary_name, alias in pairs]
+        for primary_name, alias in rows:
+            if not primary_name:
+                raise ValueError("Primary name cannot be empty")
+            if not alias:
+                raise ValueError("Alias cannot be empty")
 
-        self.conn.commit()
+        with self._transaction():
+            self.conn.executemany(_UPSERT_ALIAS, rows)
+
+        self._index.primary_by_alias.update((alias, primary_name) for primary_name, alias in rows)
+        self._index.version += 1
 
     def get_primary_name(self, alias: str) -> str | None:
         """Look up primary name for an alias.
 
-        Increments usage count when found.
+        Increments usage count when found. The increment is buffered and
+        persisted by ``list_aliases`` or ``close``.
 
         Args:
             alias: The alias to look up
@@ -128,21 +294,34 @@ class AliasDatabase:
         """
         alias = alias.strip().lower()
 
-        result = self._execute_query(
-            "SELECT primary_name, usage_count FROM aliases WHERE alias = ?", (alias,)
-        )
+        primary_name = self._index.primary_by_alias.get(alias)
+        if primary_name is not None:
+            self._usage_delta[alias] += 1
 
-        if result:
-            primary_name = result[0]["primary_name"]
-            # Increment usage count
-            new_count = result[0]["usage_count"] + 1
-            self.conn.execute(
-                "UPDATE aliases SET usage_count = ? WHERE alias = ?", (new_count, alias)
-            )
-            self.conn.commit()
-            return primary_name
+        return primary_name
+
+    def get_primary_names(self, aliases: list[str]) -> list[str | None]:
+        """Look up primary names for many aliases at once.
 
-        return None
+        Same result and usage counting as calling ``get_primary_name`` on each
+        alias, without the per-call overhead.
+
+        Args:
+            aliases: Aliases to look up
+
+        Returns:
+            Primary name (or None) for each alias, in input order
+        """
+        primary_by_alias = self._index.primary_by_alias
+        usage_delta = self._usage_delta
+        results: list[str | None] = []
+        for alias in aliases:
+            key = alias.strip().lower()
+            primary_name = primary_by_alias.get(key)
+            if primary_name is not None:
+                usage_delta[key] += 1
+            results.append(primary_name)
+        return results
 
     def list_aliases(self) -> list[MerchantAlias]:
         """List all aliases in the database.
@@ -150,6 +329,8 @@ class AliasDatabase:
         Returns:
             List of MerchantAlias objects, sorted by usage_count descending
         """
+        self._flush_usage()
+
         rows = self._execute_query(
             """SELECT primary_name, alias, created_at, usage_count
                FROM aliases
@@ -178,7 +359,10 @@ class AliasDatabase:
         alias = alias.strip().lower()
 
         cursor = self.conn.execute("DELETE FROM aliases WHERE alias = ?", (alias,))
-        self.conn.commit()
+
+        self._index.primary_by_alias.pop(alias, None)
+        self._usage_delta.pop(alias, None)
+        self._index.version += 1
 
         return cursor.rowcount > 0
 
@@ -192,27 +376,100 @@ class AliasDatabase:
         Returns:
             List of matching aliases, sorted by similarity descending
         """
-        description = description.strip().lower()
+        return list(
+            self._find_similar_cached(description.strip().lower(), threshold, self._index.version)
+        )
+
+    def _find_similar_uncached(
+        self, description: str, threshold: float, _version: int
+    ) -> tuple[str, ...]:
+        """Compute similar aliases for a normalized description.
 
-        # Get all aliases
-        aliases = self.list_aliases()
+        Memoized by the caller; ``_version`` only keys the cache so that any
+        write to the alias table invalidates earlier results.
+        """
+        # One batched C++ call; results come back sorted by score descending.
+        # No score_cutoff: rapidfuzz applies it on the 0-100 scale and can drop
+        # a score equal to the threshold, so filter with the exact comparison
+        matches = process.extract(
+            description,
+            list(self._index.primary_by_alias),
+            scorer=fuzz.ratio,
+            limit=None,
+        )
+        return tuple(alias for alias, score, _ in matches if score / 100.0 >= threshold)
 
-        # Calculate similarity scores
-        matches = []
-        for alias_obj in aliases:
-            similarity = fuzz.ratio(description, alias_obj.alias) / 100.0
-            if similarity >= threshold:
-                matches.append((similarity, alias_obj.alias))
+    def batch_find_similar(
+        self, descriptions: list[str], threshold: float = 0.8
+    ) -> list[list[str]]:
+        """Find similar aliases for many descriptions at once.
 
-        # Sort by similarity descending
-        matches.sort(key=lambda x: x[0], reverse=True)
+        Scores every distinct description against every alias with a single
+        ``process.cdist`` call instead of one search per description; repeated
+        descriptions share one row of the score matrix.
 
-        return [alias for _, alias in matches]
+        Args:
+            descriptions: Descriptions to search for
+            threshold: Minimum similarity score (0.0 to 1.0)
+
+        Returns:
+            One list per description of matching aliases, sorted by similarity descending
+        """
+        aliases = list(self._index.primary_by_alias)
+        if not descriptions or not aliases:
+            return [[] for _ in descriptions]
+
+        # Bulk imports repeat merchants heavily; score each normalized string once
+        row_by_query: dict[str, int] = {}
+        rows = [row_by_query.setdefault(d.strip().lower(), len(row_by_query)) for d in descriptions]
+
+        scores = process.cdist(
+            list(row_by_query),
+            aliases,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=-1,
+        )
+
+        unique_results = []
+        for row in scores:
+            hits = np.flatnonzero(row / 100.0 >= threshold)
+            order = hits[np.argsort(-row[hits], kind="stable")]
+            unique_results.append([aliases[i] for i in order])
+        return [list(unique_results[row]) for row in rows]
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Persist buffered usage counts and release the shared connection.
+
+        The connection is closed once no other instance on the same file is
+        still open. Calling close more than once is harmless.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        shared = self._shared
+        if self._pool_key is not None and self._pool.get(self._pool_key) is not shared:
+            # Already closed by close_all(); buffered counts are dropped
+            self._usage_delta.clear()
+            return
+        self._flush_usage()
+        shared.refs -= 1
+        if shared.refs <= 0:
+            if self._pool_key is not None:
+                del self._pool[self._pool_key]
+            shared.conn.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled connection, e.g. at process shutdown.
+
+        Usage counts still buffered in open instances are not written; call
+        ``close`` on those instances first to persist them.
+        """
+        for shared in cls._pool.values():
+            shared.conn.close()
+        cls._pool.clear()
 
     def __enter__(self):
         """Context manager entry."""
@@ -238,13 +495,15 @@ def seed_defaults(db: AliasDatabase) -> None:
     Args:
         db: AliasDatabase instance to seed
     """
-    for primary_name, aliases in DEFAULT_ALIASES.items():
-        for alias in aliases:
-            try:
-                db.add_alias(primary_name, alias)
-            except ValueError:
-                # Skip invalid entries (empty strings, etc.)
-                continue
+    # Skip invalid entries (empty strings, etc.)
+    db.bulk_add_aliases(
+        [
+            (primary_name, alias)
+            for primary_name, aliases in DEFAULT_ALIASES.items()
+            for alias in aliases
+            if primary_name.strip() and alias.strip()
+        ]
+    )
 
 
 __all__ = ["MerchantAlias", "AliasDatabase", "DEFAULT_ALIASES", "seed_defaults"]
@@ -4,17 +4,31 @@ Mitigation #3: Detect and normalize different amount formats (Debit/Credit colum
 Mitigation #4: Infer and parse various date formats (US, EU, ISO)
 """
 
+import importlib.util
+import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from dateutil import parser as date_parser
 from rapidfuzz import fuzz, process
 
 from src.models import ColumnMapping
 
+# Date-sniffing patterns for infer_date_format, compiled once at import
+_ISO_RE = re.compile(r"(?:19|20)\d{2}-\d{1,2}-\d{1,2}")
+_SLASH_RE = re.compile(r"^(\d{1,2})/(\d{1,2})")
+# Trailing UTC offset after a clock time ("T23:00:00-05:00", "10:00Z", "10:00 +0100")
+_UTC_OFFSET_RE = re.compile(r"(\d:\d\d(?::\d\d(?:\.\d+)?)?)\s*(?:Z|[+-]\d\d:?\d\d)$")
+
+# Arrow-backed strings when pyarrow is installed (optional), Python-backed otherwise
+_DESCRIPTION_DTYPE = pd.StringDtype(
+    "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "python"
+)
+
 
 def detect_column_mapping(df: pd.DataFrame, _source_type: str | None) -> ColumnMapping:
     """Detect column mappings and bank format type.
@@ -32,6 +46,36 @@ def detect_column_mapping(df: pd.DataFrame, _source_type: str | None) -> ColumnM
     columns = df.columns.tolist()
     column_lower = [col.lower() for col in columns]
 
+    # Lowercased name -> original column (first occurrence wins), for O(1) exact lookups
+    lookup: dict[str, str] = {}
+    for col in columns:
+        lookup.setdefault(col.lower(), col)
+
+    # Include Gemini/Google card: "Transaction Post Date" / "Description of Transaction"
+    # Date keywords prefer Transaction Date over Post Date
+    date_keywords = [
+        "transaction date",
+        "transaction post date",
+        "date",
+        "dt",
+        "trans date",
+        "post date",
+    ]
+    amount_keywords = ["amount", "amt", "usd"]
+    desc_keywords = [
+        "description",
+        "description of transaction",
+        "desc",
+        "descript",
+        "memo",
+        "merchant",
+    ]
+
+    # Fuzzy scores for every keyword x column, computed with one cdist call on first need
+    fuzzy_keywords = [*date_keywords, *amount_keywords, *desc_keywords]
+    fuzzy_rows = {keyword: i for i, keyword in enumerate(fuzzy_keywords)}
+    fuzzy_scores: np.ndarray | None = None
+
     # Fuzzy match for key columns
     def find_column(
         keywords: list[str],
@@ -39,11 +83,11 @@ def detect_column_mapping(df: pd.DataFrame, _source_type: str | None) -> ColumnM
         substring_ok: bool = True,
         fuzzy_ok: bool = True,
     ) -> str | None:
+        nonlocal fuzzy_scores
         # First try exact match (keyword equals column name)
         for keyword in keywords:
-            if keyword in column_lower:
-                idx = column_lower.index(keyword)
-                return columns[idx]
+            if keyword in lookup:
+                return lookup[keyword]
         # Then try substring match (e.g. "date" in "transaction post date")
         # Skip for debit/credit to avoid false matches (e.g. "debit" in "descript")
         if substring_ok:
@@ -52,34 +96,31 @@ def detect_column_mapping(df: pd.DataFrame, _source_type: str | None) -> ColumnM
                     if keyword in col:
                         return columns[i]
         # Then try fuzzy match (skip for debit/credit - avoid "debit"→"descript", "credit"→"dt")
-        if fuzzy_ok:
-            for keyword in keywords:
-                matches = process.extractOne(
-                    keyword,
+        if fuzzy_ok and columns:
+            if fuzzy_scores is None:
+                fuzzy_scores = process.cdist(
+                    fuzzy_keywords,
                     column_lower,
                     scorer=fuzz.WRatio,
                     score_cutoff=60,
+                    dtype=np.float64,
                 )
-                if matches:
-                    return columns[matches[2]]
+            for keyword in keywords:
+                scores = fuzzy_scores[fuzzy_rows[keyword]]
+                best = int(np.argmax(scores))
+                if scores[best] >= 60:
+                    return columns[best]
         return None
 
-    # Detect date column (prefer Transaction Date over Post Date)
-    # Include Gemini/Google card: "Transaction Post Date"
-    date_col = find_column(
-        ["transaction date", "transaction post date", "date", "dt", "trans date", "post date"]
-    )
+    date_col = find_column(date_keywords)
 
     # Detect amount-related columns
-    amount_col = find_column(["amount", "amt", "usd"])
+    amount_col = find_column(amount_keywords)
     debit_col = find_column(["debit"], substring_ok=False, fuzzy_ok=False)
     credit_col = find_column(["credit"], substring_ok=False, fuzzy_ok=False)
 
     # Detect description column
-    # Include Gemini/Google card: "Description of Transaction"
-    desc_col = find_column(
-        ["description", "description of transaction", "desc", "descript", "memo", "merchant"]
-    )
+    desc_col = find_column(desc_keywords)
 
     # Determine format type
     format_type: Literal["chase", "generic", "gemini"]
@@ -118,32 +159,22 @@ def infer_date_format(dates: pd.Series) -> dict:
     """
     hints = {"dayfirst": False, "yearfirst": False}
 
-    sample = dates.dropna().head(10)
+    # Whole-sample string ops are cheap, so look at more rows than a Python loop would
+    sample = dates.dropna().head(50).astype(str).str.strip()
     if len(sample) == 0:
         return hints
 
-    for date_str in sample:
-        date_str = str(date_str).strip()
-
-        # Check for ISO format (YYYY-MM-DD)
-        if date_str.startswith(("20", "19")) and "-" in date_str:
-            parts = date_str.split("-")
-            if len(parts) >= 3 and len(parts[0]) == 4:
-                hints["yearfirst"] = True
-                return hints
-
-        # Check for slash format
-        if "/" in date_str:
-            parts = date_str.split("/")
-            if len(parts) >= 2:
-                try:
-                    first, second = int(parts[0]), int(parts[1])
-                    if first > 12 and second <= 12:
-                        # Day > 12 indicates DMY format
-                        hints["dayfirst"] = True
-                        return hints
-                except ValueError:
-                    continue
+    # Check for ISO format (YYYY-MM-DD)
+    if sample.str.match(_ISO_RE).any():
+        hints["yearfirst"] = True
+        return hints
+
+    # Check for slash format: first part > 12 with second part <= 12 indicates DMY
+    parts = sample.str.extract(_SLASH_RE)
+    first = pd.to_numeric(parts[0], errors="coerce")
+    second = pd.to_numeric(parts[1], errors="coerce")
+    if ((first > 12) & (second <= 12)).any():
+        hints["dayfirst"] = True
 
     return hints
 
@@ -152,6 +183,8 @@ def standardize_date(date_val: Any, format_hints: dict) -> datetime | None:
     """Parse and standardize a date value.
 
     Mitigation #4: Use detected format hints to parse ambiguous dates.
+    Scalar counterpart of the vectorized ``pd.to_datetime`` call in
+    ``normalize_dataframe``.
 
     Args:
         date_val: Raw date value from CSV
@@ -206,6 +239,96 @@ def standardize_amount(row: pd.Series, mapping: ColumnMapping) -> Decimal | None
         return None
 
 
+def _decimal_or_none(text: str) -> Decimal | None:
+    """Convert text to Decimal, returning None where ``Decimal`` rejects it.
+
+    Args:
+        text: Amount text
+
+    Returns:
+        Decimal value, or None if the text is not a valid Decimal
+    """
+    try:
+        return Decimal(text)
+    except InvalidOperation:
+        return None
+
+
+def _parse_decimal_column(values: pd.Series) -> pd.Series:
+    """Parse a raw amount column into Decimals using whole-column string ops.
+
+    Currency symbols, thousands separators and surrounding whitespace are stripped
+    in one vectorized pass. Validity is decided by ``Decimal`` itself, exactly as
+    in ``standardize_amount``, so inputs such as ``"1_000"`` still parse.
+
+    Args:
+        values: Raw amount column from the CSV
+
+    Returns:
+        Object Series of Decimal values (None where missing or unparseable)
+    """
+    cleaned = values.astype(str).str.replace(r"[$,]", "", regex=True).str.strip()
+    present = values.notna()
+
+    parsed = pd.Series(None, index=values.index, dtype=object)
+    parsed[present] = cleaned[present].map(_decimal_or_none)
+    return parsed
+
+
+def _parse_chase_cell(value: Any) -> Decimal | None:
+    """Parse one Debit/Credit cell exactly like ``standardize_amount``.
+
+    Missing and empty cells count as zero. Unlike the single amount column,
+    currency symbols and thousands separators are not stripped, so a cell
+    such as ``"$1,234.56"`` (or whitespace only) is unparseable.
+
+    Args:
+        value: Raw Debit or Credit cell
+
+    Returns:
+        Decimal value, or None if the cell cannot be parsed
+    """
+    if pd.isna(value) or not value:
+        return Decimal(0)
+    return _decimal_or_none(str(value))
+
+
+def _vectorized_amounts(df: pd.DataFrame, mapping: ColumnMapping) -> pd.Series:
+    """Normalize the amount column(s) of a whole DataFrame to signed Decimals.
+
+    Column-at-a-time equivalent of ``standardize_amount``: avoids building a
+    pandas Series per row via ``df.apply(..., axis=1)``.
+
+    Args:
+        df: Raw DataFrame
+        mapping: Column mapping for the CSV format
+
+    Returns:
+        Object Series of signed Decimals (None where parsing fails)
+    """
+    missing = pd.Series(None, index=df.index, dtype=object)
+
+    if mapping.format_type == "chase":
+        # Chase: Credit - Debit; empty cells count as zero, garbage invalidates the row
+        def chase_leg(col: str | None) -> pd.Series:
+            if not col or col not in df.columns:
+                return pd.Series(Decimal(0), index=df.index, dtype=object)
+            return df[col].map(_parse_chase_cell).astype(object)
+
+        debit = chase_leg(mapping.debit)
+        credit = chase_leg(mapping.credit)
+        invalid = debit.isna() | credit.isna()
+        if invalid.all():
+            return missing
+        amounts = credit.mask(invalid, Decimal(0)) - debit.mask(invalid, Decimal(0))
+        return amounts.astype(object).mask(invalid, None)
+
+    # Generic/Gemini: single signed amount column
+    if not mapping.amount or mapping.amount not in df.columns:
+        return missing
+    return _parse_decimal_column(df[mapping.amount])
+
+
 def detect_sign_convention(df: pd.DataFrame, mapping: ColumnMapping) -> dict[str, str | int]:
     """Detect the sign convention for debits/credits in the CSV.
 
@@ -239,10 +362,10 @@ def detect_sign_convention(df: pd.DataFrame, mapping: ColumnMapping) -> dict[str
         credit_count = 0
 
         if debit_col and debit_col in df.columns:
-            debit_count = df[debit_col].notna().sum()
+            debit_count = int(np.count_nonzero(pd.notna(df[debit_col].to_numpy())))
 
         if credit_col and credit_col in df.columns:
-            credit_count = df[credit_col].notna().sum()
+            credit_count = int(np.count_nonzero(pd.notna(df[credit_col].to_numpy())))
 
         result["debit_sign"] = "debit_col"
         result["credit_sign"] = "credit_col"
@@ -261,10 +384,13 @@ def detect_sign_convention(df: pd.DataFrame, mapping: ColumnMapping) -> dict[str
             return result
 
         # Convert amounts to numeric, ignoring errors
-        amounts = pd.to_numeric(df[amount_col], errors="coerce")
+        amounts = pd.to_numeric(df[amount_col], errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
 
-        positive_count = int((amounts > 0).sum())
-        negative_count = int((amounts < 0).sum())
+        # Count negatives, zeros and positives in one pass: sign -1/0/1 -> bins 0/1/2
+        signs = np.sign(amounts[~np.isnan(amounts)]).astype(np.intp)
+        negative_count, _, positive_count = (int(n) for n in np.bincount(signs + 1, minlength=3))
 
         result["positive_count"] = positive_count
         result["negative_count"] = negative_count
@@ -296,31 +422,66 @@ def normalize_dataframe(df: pd.DataFrame, mapping: ColumnMapping, date_hints: di
     Returns:
         Normalized DataFrame with date_clean, amount_clean, description_clean columns
     """
-    # Create a copy to avoid modifying original
-    df = df.copy()
-
     # Get the raw column names
     date_col = mapping.date or "date"
     desc_col = mapping.description or "description"
 
-    # Normalize dates
+    # Build the clean columns as standalone Series; the raw frame is never copied whole
+    # Normalize dates (single vectorized parse instead of per-row dateutil calls).
+    # Values are parsed from their text form like standardize_date does, so an
+    # integer YYYYMMDD column is not read as epoch nanoseconds; UTC offsets are
+    # stripped first so each timestamp keeps its local wall time and the column
+    # stays tz-naive even when offsets are mixed
     if date_col in df.columns:
-        df["date_clean"] = df[date_col].apply(lambda x: standardize_date(x, date_hints))
+        date_text = df[date_col].astype(str).str.replace(_UTC_OFFSET_RE, r"\1", regex=True)
+        date_clean = pd.to_datetime(
+            date_text,
+            errors="coerce",
+            format="mixed",
+            dayfirst=date_hints.get("dayfirst", False),
+            yearfirst=date_hints.get("yearfirst", False),
+        )
     else:
-        df["date_clean"] = None
+        date_clean = pd.Series(None, index=df.index, dtype=object)
 
-    # Normalize amounts
-    df["amount_clean"] = df.apply(lambda row: standardize_amount(row, mapping), axis=1)
+    # Normalize amounts (whole-column ops, no per-row apply)
+    amount_clean = _vectorized_amounts(df, mapping)
 
     # Normalize descriptions
     if desc_col in df.columns:
-        df["description_clean"] = df[desc_col].astype(str).str.strip().str.lower()
+        description_clean = df[desc_col].astype(_DESCRIPTION_DTYPE).str.strip().str.lower()
     else:
-        df["description_clean"] = ""
+        description_clean = pd.Series("", index=df.index, dtype=_DESCRIPTION_DTYPE)
+
+    # Filter out rows with failed normalization, then attach the clean columns
+    mask = date_clean.notna() & amount_clean.notna()
+    return df.loc[mask].assign(
+        date_clean=date_clean[mask],
+        amount_clean=amount_clean[mask],
+        description_clean=description_clean[mask],
+    )
+
+
+# Non-mapped columns that downstream steps still read (e.g. main's reconciled filter)
+_PASSTHROUGH_COLUMNS = ("reconciled",)
 
-    # Filter out rows with failed normalization
-    df = df.dropna(subset=["date_clean", "amount_clean"])
 
+def _read_csv(path: Path, **kwargs: Any) -> pd.DataFrame:
+    """Read a CSV, retrying with latin-1 if the default encoding fails.
+
+    Args:
+        path: Path to CSV file
+        **kwargs: Extra arguments for pd.read_csv
+
+    Returns:
+        Loaded DataFrame
+    """
+    df: pd.DataFrame
+    try:
+        df = pd.read_csv(path, engine="c", **kwargs)
+    except UnicodeDecodeError:
+        # Try with different encoding
+        df = pd.read_csv(path, engine="c", encoding="latin-1", **kwargs)
     return df
 
 
@@ -329,6 +490,9 @@ def load_csv(
 ) -> tuple[pd.DataFrame, ColumnMapping, dict]:
     """Load and normalize a CSV file.
 
+    Reads the header first to detect the column mapping, then parses only
+    the mapped columns (plus passthrough columns such as ``reconciled``).
+
     Args:
         path: Path to CSV file
         source_type: Optional hint about source type
@@ -336,21 +500,23 @@ def load_csv(
     Returns:
         Tuple of (normalized DataFrame, column mapping, sign convention dict)
     """
-    # Load CSV with encoding handling
-    try:
-        df = pd.read_csv(path)
-    except UnicodeDecodeError:
-        # Try with different encoding
-        df = pd.read_csv(path, encoding="latin-1")
+    # Detect column mapping from the header alone
+    header = _read_csv(path, nrows=0)
+    mapping = detect_column_mapping(header, source_type)
 
-    # Detect column mapping
-    mapping = detect_column_mapping(df, source_type)
+    # Re-read only the columns normalization needs
+    date_col = mapping.date or "date"
+    desc_col = mapping.description or "description"
+    amount_col = mapping.amount or "amount"
+    wanted = {date_col, desc_col, amount_col, mapping.debit, mapping.credit, *_PASSTHROUGH_COLUMNS}
+    usecols = [col for col in header.columns if col in wanted]
+    dtypes = {desc_col: str} if desc_col in usecols else None
+    df = _read_csv(path, usecols=usecols, dtype=dtypes)
 
     # Detect sign convention (before normalization, on raw data)
     sign_convention = detect_sign_convention(df, mapping)
 
     # Infer date format from the date column
-    date_col = mapping.date or "date"
     date_hints = infer_date_format(df[date_col]) if date_col in df.columns else {}
 
     # Normalize DataFrame
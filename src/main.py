@@ -3,8 +3,10 @@
 Provides CSV reconciliation with dry-run mode and interactive TUI.
 """
 
+from collections import Counter
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import typer
 
@@ -13,6 +15,35 @@ from src.csv_loader import load_csv
 from src.matcher import MatchConfig, find_matches, normalize_sign_conventions
 from src.models import ConfidenceTier
 
+# Text forms of a "reconciled" cell that mean the record is still open
+_UNRECONCILED_VALUES = frozenset({"false", "0", ""})
+
+# Dry-run listing lines written per typer.echo call
+_DRY_RUN_CHUNK_LINES = 200
+
+
+def _unreconciled_mask(reconciled: pd.Series) -> np.ndarray:
+    """Boolean mask of records that are not yet reconciled.
+
+    Each distinct value is classified once (by its lowercased text form) and
+    the decision is broadcast back through its factorized code, instead of
+    building a lowercased string copy of the whole column.
+
+    Args:
+        reconciled: The target "reconciled" column
+
+    Returns:
+        True where the value is false/0/empty or missing
+    """
+    codes, uniques = pd.factorize(reconciled)
+    open_values = np.fromiter(
+        (str(value).lower() in _UNRECONCILED_VALUES for value in uniques),
+        dtype=bool,
+        count=len(uniques),
+    )
+    # Missing values factorize to -1 and always count as unreconciled
+    return np.append(open_values, True)[codes]
+
 
 def reconcile(
     source: Path = typer.Argument(..., help="Source CSV file (bank statement)"),
@@ -71,24 +102,19 @@ def reconcile(
     # Report record counts BEFORE filtering
     typer.echo(f"\nLoaded {len(source_df)} source records, {len(target_df)} target records")
 
+    # Target rows to keep; the reconciled and date filters below combine into
+    # this mask and the target is subset once, before sorting
+    keep_target = np.ones(len(target_df), dtype=bool)
+
     # Filter out already-reconciled target records FIRST
     # This removes personal records that have already been matched in previous runs
-    # Done early to reduce data size before any processing
     if "reconciled" in target_df.columns:
-        original_target_count = len(target_df)
-
         # Filter to only include records where reconciled is not True (case-insensitive)
         # Accept: false, False, FALSE, 0, empty string, NaN
         # Reject: true, True, TRUE, 1
-        target_df = target_df[
-            target_df["reconciled"].astype(str).str.lower().isin(["false", "0", ""])
-            | target_df["reconciled"].isna()
-        ].copy()
+        keep_target &= _unreconciled_mask(target_df["reconciled"])
 
-        # Reset index after filtering
-        target_df.reset_index(drop=True, inplace=True)
-
-        filtered_count = original_target_count - len(target_df)
+        filtered_count = len(target_df) - int(np.count_nonzero(keep_target))
         if filtered_count > 0:
             typer.echo(f"Filtered {filtered_count} already-reconciled target record(s)")
 
@@ -116,20 +142,19 @@ def reconcile(
             from datetime import timedelta
 
             cutoff_date = latest_source_date + timedelta(days=1)
-            original_target_count = len(target_df)
-
-            # Filter target_df to only include records with dates <= cutoff
-            target_df = target_df[target_df["date_clean"] <= cutoff_date].copy()
-
-            # Reset index after filtering
-            target_df.reset_index(drop=True, inplace=True)
 
-            filtered_count = original_target_count - len(target_df)
+            # Keep only records with dates <= cutoff
+            in_range = (target_df["date_clean"] <= cutoff_date).to_numpy(dtype=bool)
+            filtered_count = int(np.count_nonzero(keep_target & ~in_range))
+            keep_target &= in_range
             if filtered_count > 0:
                 typer.echo(
                     f"Filtered {filtered_count} target records dated after {cutoff_date.strftime('%Y-%m-%d')} (latest source date + 1 day)"
                 )
 
+    if not keep_target.all():
+        target_df = target_df[keep_target].reset_index(drop=True)
+
     # Sort both DataFrames by date ascending so duplicate matches (e.g. MTA) pair chronologically
     if "date_clean" in source_df.columns:
         source_df = source_df.sort_values("date_clean", ascending=True).reset_index(drop=True)
@@ -145,14 +170,19 @@ def reconcile(
     alias_db = AliasDatabase(alias_db_path)
     seed_defaults(alias_db)
 
-    result = find_matches(
-        source_df, target_df, config, min_confidence=min_confidence, alias_db=alias_db
-    )
+    try:
+        result = find_matches(
+            source_df, target_df, config, min_confidence=min_confidence, alias_db=alias_db
+        )
+    finally:
+        # Persists buffered alias usage counts
+        alias_db.close()
 
-    # Count tiers
-    high_tier = sum(1 for m in result.matches if m.tier == ConfidenceTier.HIGH)
-    medium_tier = sum(1 for m in result.matches if m.tier == ConfidenceTier.MEDIUM)
-    low_tier = sum(1 for m in result.matches if m.tier == ConfidenceTier.LOW)
+    # Count tiers in a single pass over the matches
+    tier_counts = Counter(m.tier for m in result.matches)
+    high_tier = tier_counts[ConfidenceTier.HIGH]
+    medium_tier = tier_counts[ConfidenceTier.MEDIUM]
+    low_tier = tier_counts[ConfidenceTier.LOW]
 
     # Print results
     typer.echo("\n" + "=" * 50)
@@ -170,55 +200,72 @@ def reconcile(
         )
 
     if dry_run:
-        # Show all matches with amounts
-        if result.matches:
-            typer.echo("\n" + "-" * 50)
-            typer.echo("MATCHES (Source Amt → Target Amt)")
-            typer.echo("-" * 50)
-            for match in result.matches:
-                source_rec = source_df.iloc[match.source_idx]
-                source_amt = f"${source_rec['amount_clean']:.2f}"
-                source_desc = source_rec["description_clean"][:40]
-
-                if match.target_idx is not None:
-                    target_rec = target_df.iloc[match.target_idx]
-                    target_amt = f"${target_rec['amount_clean']:.2f}"
-                    target_desc = target_rec["description_clean"][:40]
-                    typer.echo(
-                        f"  [{match.tier.value}] {match.confidence:.2f} {source_amt} → {target_amt}"
+        # Buffer the listing and write it in bounded chunks, so long listings
+        # stream out and lines already built are still shown if formatting fails
+        lines: list[str] = []
+
+        def flush() -> None:
+            if lines:
+                typer.echo("\n".join(lines))
+                lines.clear()
+
+        def emit(line: str) -> None:
+            lines.append(line)
+            if len(lines) >= _DRY_RUN_CHUNK_LINES:
+                flush()
+
+        try:
+            # Show all matches with amounts
+            if result.matches:
+                emit("\n" + "-" * 50)
+                emit("MATCHES (Source Amt → Target Amt)")
+                emit("-" * 50)
+                for match in result.matches:
+                    source_rec = source_df.iloc[match.source_idx]
+                    source_amt = f"${source_rec['amount_clean']:.2f}"
+                    source_desc = source_rec["description_clean"][:40]
+
+                    if match.target_idx is not None:
+                        target_rec = target_df.iloc[match.target_idx]
+                        target_amt = f"${target_rec['amount_clean']:.2f}"
+                        target_desc = target_rec["description_clean"][:40]
+                        emit(
+                            f"  [{match.tier.value}] {match.confidence:.2f} {source_amt} → {target_amt}"
+                        )
+                        emit(f"      {source_desc} → {target_desc}")
+                    else:
+                        emit(
+                            f"  [{match.tier.value}] {match.confidence:.2f} {source_amt} → (no match)"
+                        )
+                        emit(f"      {source_desc}")
+
+            # Show missing source records
+            if result.missing_in_target:
+                emit("\n" + "-" * 50)
+                emit(f"MISSING IN TARGET ({len(result.missing_in_target)} records)")
+                emit("-" * 50)
+                for idx in result.missing_in_target[:10]:  # Show first 10
+                    rec = source_df.iloc[idx]
+                    emit(
+                        f"  {rec['date_clean'].strftime('%Y-%m-%d')} | ${rec['amount_clean']:.2f} | {rec['description_clean'][:60]}"
                     )
-                    typer.echo(f"      {source_desc} → {target_desc}")
-                else:
-                    typer.echo(
-                        f"  [{match.tier.value}] {match.confidence:.2f} {source_amt} → (no match)"
+                if len(result.missing_in_target) > 10:
+                    emit(f"  ... and {len(result.missing_in_target) - 10} more")
+
+            # Show unmatched target records
+            if result.missing_in_source:
+                emit("\n" + "-" * 50)
+                emit(f"UNMATCHED TARGETS ({len(result.missing_in_source)} records)")
+                emit("-" * 50)
+                for idx in result.missing_in_source[:10]:  # Show first 10
+                    rec = target_df.iloc[idx]
+                    emit(
+                        f"  {rec['date_clean'].strftime('%Y-%m-%d')} | ${rec['amount_clean']:.2f} | {rec['description_clean'][:60]}"
                     )
-                    typer.echo(f"      {source_desc}")
-
-        # Show missing source records
-        if result.missing_in_target:
-            typer.echo("\n" + "-" * 50)
-            typer.echo(f"MISSING IN TARGET ({len(result.missing_in_target)} records)")
-            typer.echo("-" * 50)
-            for idx in result.missing_in_target[:10]:  # Show first 10
-                rec = source_df.iloc[idx]
-                typer.echo(
-                    f"  {rec['date_clean'].strftime('%Y-%m-%d')} | ${rec['amount_clean']:.2f} | {rec['description_clean'][:60]}"
-                )
-            if len(result.missing_in_target) > 10:
-                typer.echo(f"  ... and {len(result.missing_in_target) - 10} more")
-
-        # Show unmatched target records
-        if result.missing_in_source:
-            typer.echo("\n" + "-" * 50)
-            typer.echo(f"UNMATCHED TARGETS ({len(result.missing_in_source)} records)")
-            typer.echo("-" * 50)
-            for idx in result.missing_in_source[:10]:  # Show first 10
-                rec = target_df.iloc[idx]
-                typer.echo(
-                    f"  {rec['date_clean'].strftime('%Y-%m-%d')} | ${rec['amount_clean']:.2f} | {rec['description_clean'][:60]}"
-                )
-            if len(result.missing_in_source) > 10:
-                typer.echo(f"  ... and {len(result.missing_in_source) - 10} more")
+                if len(result.missing_in_source) > 10:
+                    emit(f"  ... and {len(result.missing_in_source) - 10} more")
+        finally:
+            flush()
 
     if dry_run:
         typer.echo("\nDry run complete. Use --min-confidence to adjust minimum threshold.")
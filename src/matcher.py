@@ -9,26 +9,36 @@ intelligent match (first-two-words) and confidence (fuzzy) both resolve aliases
 through the DB first. The alias DB is the only source of merchant equivalence.
 """
 
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from src.models import ConfidenceTier, Match, MatchConfig, MatchDecision, MatchResult
 
+_DAY_NS = 86_400_000_000_000
+# Largest cent amount whose differences still fit comfortably in int64
+_MAX_CENTS = 2**62
+
 
 def _get_row_field(row: Any, field: str) -> Any:
-    """Safely get a field value from a pandas Series or itertuples namedtuple.
+    """Safely get a field value from a pandas Series, dict or itertuples namedtuple.
 
     Args:
-        row: A pandas Series or namedtuple from itertuples()
+        row: A pandas Series, dict or namedtuple from itertuples()
         field: Field name to retrieve
 
     Returns:
         Field value or None if not found
     """
-    # Try dictionary-style access first (Series)
+    # Namedtuples only support attribute access; skip the failing lookup
+    if isinstance(row, tuple):
+        return getattr(row, field, None)
+    # Try dictionary-style access first (Series, dict)
     try:
         return row[field]
     except (KeyError, TypeError):
@@ -37,35 +47,42 @@ def _get_row_field(row: Any, field: str) -> Any:
     return getattr(row, field, None)
 
 
-def _normalize_for_intelligent_match(text: str) -> str:
-    """Normalize text for intelligent matching.
+def _is_missing(value: Any) -> bool:
+    """Scalar equivalent of pd.isna without pandas' type dispatch.
 
-    Removes apostrophes and converts to lowercase for comparison.
+    The missing-value singletons are checked by identity and NaN floats,
+    Decimals and datetime64 values by self-inequality; anything whose
+    comparison raises falls back to pd.isna.
 
     Args:
-        text: Text to normalize
+        value: A single record field
 
     Returns:
-        Normalized text string
+        True if the value counts as missing
     """
-    return text.lower().replace("'", "")
+    if value is None or value is pd.NA or value is pd.NaT:
+        return True
+    try:
+        return bool(value != value)
+    except (ArithmeticError, TypeError, ValueError):
+        return bool(pd.isna(value))
+
 
+@lru_cache(maxsize=8192)
+def _normalize_for_intelligent_match(text: str) -> str:
+    """Normalize text for intelligent matching.
 
-def _get_first_two_words(text: str) -> str:
-    """Extract first two words from text for intelligent matching.
+    Removes apostrophes and converts to lowercase for comparison. Memoized:
+    merchant strings repeat heavily across records and scalar scoring calls.
+    Alias resolution stays uncached since lookups also count alias usage.
 
     Args:
-        text: Text to extract words from
+        text: Text to normalize
 
     Returns:
-        First two words (normalized, joined by space) or single word if only one
+        Normalized text string
     """
-    words = text.lower().split()
-    if len(words) >= 2:
-        return " ".join(words[:2])
-    elif len(words) == 1:
-        return words[0]
-    return ""
+    return text.lower().replace("'", "")
 
 
 def _description_for_matching(description: str, alias_db: Any | None) -> str:
@@ -94,6 +111,102 @@ def _description_for_matching(description: str, alias_db: Any | None) -> str:
     return _normalize_for_intelligent_match(s)
 
 
+def _canonical_descriptions(keys: list[str], alias_db: Any | None) -> list[str]:
+    """Canonical form of many distinct description keys, resolved in one pass.
+
+    Same result as _description_for_matching on each key. Alias databases
+    that offer ``get_primary_names`` are queried once for the whole batch.
+
+    Args:
+        keys: Distinct stripped, lowercased descriptions
+        alias_db: Optional AliasDatabase for resolution
+
+    Returns:
+        Canonical description for each key, in input order
+    """
+    if alias_db is None:
+        resolved = keys
+    elif hasattr(alias_db, "get_primary_names"):
+        lookup = [key for key in keys if key]
+        primary_by_key = dict(zip(lookup, alias_db.get_primary_names(lookup), strict=True))
+        resolved = [primary_by_key.get(key) or key for key in keys]
+    else:
+        return [_description_for_matching(key, alias_db) for key in keys]
+    # _normalize_for_intelligent_match inlined over the batch: keys are
+    # distinct, so the memo would only add a lookup per key
+    return [key.lower().replace("'", "") for key in resolved]
+
+
+def _intern_descriptions(
+    source_descs: pd.Series,
+    target_descs: pd.Series,
+    alias_db: Any | None,
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """Map every description to an int32 code of its canonical form.
+
+    The canonical form only depends on the stripped, lowercased description
+    (alias lookups are case-insensitive and the result is lowercased), so
+    descriptions are deduplicated on that key with vectorized string ops and
+    each distinct key is resolved through _description_for_matching once.
+    The canonical forms are then factorized jointly, so equal canonical
+    descriptions in source and target share a code. Missing descriptions map
+    to the canonical form "".
+
+    Args:
+        source_descs: Source description_clean column
+        target_descs: Target description_clean column
+        alias_db: Optional AliasDatabase for resolution
+
+    Returns:
+        Tuple of (source_codes, target_codes, vocab) where vocab[code] is the
+        canonical description string
+    """
+    raw = pd.concat([source_descs, target_descs], ignore_index=True).astype(object)
+    keys = raw.where(raw.notna(), "").astype(str).str.strip().str.lower()
+    raw_codes, raw_uniques = pd.factorize(keys)
+    canonical = _canonical_descriptions(list(raw_uniques), alias_db)
+    canonical_codes, vocab = pd.factorize(pd.Series(canonical, dtype=object))
+    codes = canonical_codes[raw_codes].astype(np.int32)
+    return codes[: len(source_descs)], codes[len(source_descs) :], list(vocab)
+
+
+@lru_cache(maxsize=4096)
+def _first_two_key(canonical: str) -> str | None:
+    """First-two-words key of a canonical description, tokenized once.
+
+    Canonical descriptions are already lowercased, so splitting on
+    whitespace is all that is left to do. Memoized for the scalar scoring
+    APIs, which resolve the same canonical forms for every pair they are
+    called on.
+
+    Args:
+        canonical: Canonical description (see _description_for_matching)
+
+    Returns:
+        First two words joined by a space, or None when there are fewer than
+        two words (not eligible for intelligent match)
+    """
+    words = canonical.split(maxsplit=2)
+    if len(words) < 2:
+        return None
+    return f"{words[0]} {words[1]}"
+
+
+def _first_two_word_codes(vocab: list[str]) -> np.ndarray:
+    """Intern the first-two-words key of each canonical description.
+
+    Args:
+        vocab: Canonical descriptions indexed by description code
+
+    Returns:
+        int32 array aligned with vocab; -1 where the description has fewer than
+        two words (not eligible for intelligent match)
+    """
+    keys = [_first_two_key(description) for description in vocab]
+    codes, _ = pd.factorize(pd.Series(keys, dtype=object), use_na_sentinel=True)
+    return codes.astype(np.int32)
+
+
 def _check_intelligent_match(
     source: Any,
     target: Any,
@@ -120,7 +233,7 @@ def _check_intelligent_match(
     source_amount = _get_row_field(source, "amount_clean")
     target_amount = _get_row_field(target, "amount_clean")
 
-    if pd.isna(source_amount) or pd.isna(target_amount):
+    if _is_missing(source_amount) or _is_missing(target_amount):
         return None
 
     if source_amount != target_amount:
@@ -129,16 +242,13 @@ def _check_intelligent_match(
     source_desc = _get_row_field(source, "description_clean")
     target_desc = _get_row_field(target, "description_clean")
 
-    if pd.isna(source_desc) or pd.isna(target_desc):
+    if _is_missing(source_desc) or _is_missing(target_desc):
         return None
 
-    source_canonical = _description_for_matching(str(source_desc), alias_db)
-    target_canonical = _description_for_matching(str(target_desc), alias_db)
-
-    source_first_two = _get_first_two_words(source_canonical)
-    target_first_two = _get_first_two_words(target_canonical)
+    source_first_two = _first_two_key(_description_for_matching(str(source_desc), alias_db))
+    target_first_two = _first_two_key(_description_for_matching(str(target_desc), alias_db))
 
-    if len(source_canonical.split()) < 2 or len(target_canonical.split()) < 2:
+    if source_first_two is None or target_first_two is None:
         return None
 
     if source_first_two == target_first_two:
@@ -187,20 +297,40 @@ def normalize_sign_conventions(
     # Example: source uses "-" for debits, target uses "+" for debits
     # We'll flip target so both use the same sign for the same transaction type
     if source_debit_sign != target_debit_sign:
-        # Flip the signs in target_df
-        target_df = target_df.copy()
-        target_df["amount_clean"] = target_df["amount_clean"].apply(
-            lambda x: -x if pd.notna(x) else x
-        )
+        # Flip the signs in target_df with one vectorized negation (missing values stay missing)
+        amounts = target_df["amount_clean"]
+        if pd.api.types.is_numeric_dtype(amounts):
+            flipped = -amounts
+        else:
+            # Decimal amounts live in an object column: negate the present values
+            # in place with a masked ufunc (no gather/scatter of the subset)
+            values = amounts.to_numpy(dtype=object, copy=True)
+            np.negative(values, out=values, where=pd.notna(values))
+            flipped = pd.Series(values, index=amounts.index, dtype=object)
+        target_df = target_df.assign(amount_clean=flipped)
 
     return source_df, target_df
 
 
+def _unreachable(best_confidence: float, threshold: float) -> bool:
+    """Whether a best-case weighted score still rounds below a threshold.
+
+    Args:
+        best_confidence: Weighted score with every remaining component at 1.0
+        threshold: Minimum confidence the caller needs
+
+    Returns:
+        True if no remaining scores can lift the confidence to threshold
+    """
+    return round(best_confidence, 4) < threshold
+
+
 def calculate_confidence(
     source: Any,
     target: Any,
     config: MatchConfig,
     alias_db: Any | None = None,
+    early_exit_threshold: float | None = None,
 ) -> float:
     """Calculate confidence score for a potential match.
 
@@ -214,26 +344,36 @@ def calculate_confidence(
         config: Matching configuration
         alias_db: Optional AliasDatabase; when provided, descriptions are
             resolved to primary name before comparison (same as rest of matcher).
+        early_exit_threshold: Optional minimum confidence the caller cares
+            about. Once the amount (then date) score makes it unreachable even
+            with perfect remaining scores, 0.0 is returned without computing
+            the rest.
 
     Returns:
-        Confidence score from 0.0 to 1.0
+        Confidence score from 0.0 to 1.0 (0.0 for pairs cut short by
+        early_exit_threshold)
     """
     # Amount match: 1.0 if equal, 0.0 otherwise
     amount_score: float = 0.0
     source_amount = _get_row_field(source, "amount_clean")
     target_amount = _get_row_field(target, "amount_clean")
     if (
-        pd.notna(source_amount)
-        and pd.notna(target_amount)
+        not _is_missing(source_amount)
+        and not _is_missing(target_amount)
         and abs(source_amount - target_amount) <= config.amount_tolerance
     ):
         amount_score = 1.0
 
+    if early_exit_threshold is not None and _unreachable(
+        (amount_score * 0.3) + 0.3 + 0.4, early_exit_threshold
+    ):
+        return 0.0
+
     # Date proximity: 1.0 if same date, decreases with distance
     date_score: float = 0.0
     source_date = _get_row_field(source, "date_clean")
     target_date = _get_row_field(target, "date_clean")
-    if pd.notna(source_date) and pd.notna(target_date):
+    if not _is_missing(source_date) and not _is_missing(target_date):
         days_diff = abs((source_date - target_date).days)
 
         if days_diff == 0:
@@ -241,11 +381,16 @@ def calculate_confidence(
         elif days_diff <= config.date_window_days:
             date_score = 1.0 - (days_diff / config.date_window_days)
 
+    if early_exit_threshold is not None and _unreachable(
+        (amount_score * 0.3) + (date_score * 0.3) + 0.4, early_exit_threshold
+    ):
+        return 0.0
+
     # Description similarity: same canonical form as intelligent match (alias DB when provided)
     desc_score: float = 0.0
     source_desc = _get_row_field(source, "description_clean")
     target_desc = _get_row_field(target, "description_clean")
-    if pd.notna(source_desc) and pd.notna(target_desc):
+    if not _is_missing(source_desc) and not _is_missing(target_desc):
         source_canonical = _description_for_matching(str(source_desc), alias_db)
         target_canonical = _description_for_matching(str(target_desc), alias_db)
         if source_canonical == target_canonical:
@@ -259,6 +404,669 @@ def calculate_confidence(
     return round(confidence, 4)
 
 
+def _amounts_to_cents(amounts: pd.Series) -> tuple[np.ndarray, np.ndarray] | None:
+    """Convert an amount column to int64 cents plus a validity mask.
+
+    Amounts stay Decimal in the DataFrames; this gives the matcher an integer
+    view for vectorized comparisons. Only exact conversions are accepted, so
+    integer comparisons give the same answers as Decimal arithmetic.
+
+    Args:
+        amounts: amount_clean column (Decimal or int values, missing allowed)
+
+    Returns:
+        Tuple of (cents, valid) arrays, or None if any amount is a float or
+        is not a whole number of cents
+    """
+    values = amounts.to_numpy(dtype=object)
+    valid = pd.notna(values)
+    # Amounts repeat heavily (fares, subscriptions), so each distinct value is
+    # converted once; equal values hash alike and share a code
+    codes, uniques = pd.factorize(values[valid])
+    unique_cents = np.zeros(len(uniques), dtype=np.int64)
+    for i, value in enumerate(uniques):
+        if not isinstance(value, Decimal | int):
+            return None
+        scaled = Decimal(value) * 100
+        if scaled != int(scaled) or abs(scaled) > _MAX_CENTS:
+            return None
+        unique_cents[i] = int(scaled)
+    cents = np.zeros(len(values), dtype=np.int64)
+    cents[valid] = unique_cents[codes]
+    return cents, valid
+
+
+def _tolerance_cents(tolerance: Decimal) -> int:
+    """Express an amount tolerance in whole cents.
+
+    Differences between cent amounts are whole cents, so rounding the
+    tolerance down keeps ``diff <= tolerance`` exact.
+    """
+    return int((Decimal(tolerance) * 100).to_integral_value(rounding=ROUND_FLOOR))
+
+
+def _round_confidence(values: np.ndarray) -> np.ndarray:
+    """Round confidence scores to 4 places exactly like the builtin round().
+
+    np.round agrees with round() except on values sitting at a rounding
+    midpoint, so only those few entries are recomputed in Python.
+
+    Args:
+        values: Float array of raw weighted scores
+
+    Returns:
+        Float64 array of rounded scores
+    """
+    rounded = np.round(values, 4)
+    scaled = values * 1e4
+    midpoint = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for idx in zip(*np.nonzero(midpoint), strict=True):
+        rounded[idx] = round(float(values[idx]), 4)
+    return rounded
+
+
+def _date_ns(dates: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a date column to int64 nanoseconds plus a validity mask.
+
+    Timezone-aware columns are converted to UTC first, so day differences
+    are taken between instants as with Timestamp subtraction.
+
+    Args:
+        dates: date_clean column (datetime64 or datetime objects)
+
+    Returns:
+        Tuple of (nanoseconds, valid) arrays
+    """
+    converted = pd.to_datetime(dates, errors="coerce")
+    if isinstance(converted.dtype, pd.DatetimeTZDtype):
+        converted = converted.dt.tz_convert("UTC").dt.tz_localize(None)
+    converted = converted.astype("datetime64[ns]")
+    valid = converted.notna().to_numpy()
+    return converted.to_numpy().view(np.int64), valid
+
+
+@dataclass(frozen=True)
+class _ScoringColumns:
+    """Struct-of-arrays view of the fields the pair scorer reads.
+
+    Built once per DataFrame so scoring only gathers from flat arrays.
+
+    Attributes:
+        amounts: amount_clean as an object array, missing values replaced by 0
+        amount_floats: amount_clean as float64, NaN where missing
+        amount_valid: Whether each amount is present
+        cents: int64 cents when every amount converts exactly, else None
+        date_ns: date_clean as int64 nanoseconds
+        date_days: date_clean as int32 day numbers when no date has a time of
+            day, else None
+        date_valid: Whether each date is present
+        desc_codes: Canonical description code per row (see _intern_descriptions)
+        first_two: First-two-words code per row (-1 when not eligible for the
+            intelligent match), or None when not computed
+        has_desc: Whether each raw description is present
+    """
+
+    amounts: np.ndarray
+    amount_floats: np.ndarray
+    amount_valid: np.ndarray
+    cents: np.ndarray | None
+    date_ns: np.ndarray
+    date_days: np.ndarray | None
+    date_valid: np.ndarray
+    desc_codes: np.ndarray
+    first_two: np.ndarray | None
+    has_desc: np.ndarray
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        desc_codes: np.ndarray,
+        amount_floats: np.ndarray | None = None,
+        first_two_codes: np.ndarray | None = None,
+    ) -> "_ScoringColumns":
+        """Extract the scoring columns of a normalized DataFrame.
+
+        Args:
+            df: Normalized source or target DataFrame
+            desc_codes: Canonical description code per row
+            amount_floats: float64 amounts if the caller already converted them
+            first_two_codes: First-two-words code per description code (see
+                _first_two_word_codes), needed for the intelligent match
+
+        Returns:
+            _ScoringColumns aligned with the rows of df
+        """
+        amounts = df["amount_clean"].to_numpy(dtype=object)
+        amount_valid = pd.notna(amounts)
+        if amount_floats is None:
+            amount_floats = df["amount_clean"].astype(float).to_numpy(dtype=np.float64)
+        converted = _amounts_to_cents(df["amount_clean"])
+        date_ns, date_valid = _date_ns(df["date_clean"])
+        date_days, time_of_day = np.divmod(date_ns, _DAY_NS)
+        return cls(
+            amounts=np.where(amount_valid, amounts, 0),
+            amount_floats=amount_floats,
+            amount_valid=amount_valid,
+            cents=None if converted is None else converted[0],
+            date_ns=date_ns,
+            date_days=(
+                None
+                if time_of_day[date_valid].any()
+                # Day numbers of valid dates fit int32 (datetime64[ns] spans
+                # about 292 years); missing dates become 0 and stay masked
+                else np.where(date_valid, date_days, 0).astype(np.int32)
+            ),
+            date_valid=date_valid,
+            desc_codes=desc_codes,
+            first_two=None if first_two_codes is None else first_two_codes[desc_codes],
+            has_desc=df["description_clean"].notna().to_numpy(),
+        )
+
+    def take(self, positions: np.ndarray) -> "_ScoringColumns":
+        """Gather the given rows into a new set of columns.
+
+        Args:
+            positions: Row positions to keep, in the order to keep them
+
+        Returns:
+            _ScoringColumns aligned with positions
+        """
+        return _ScoringColumns(
+            amounts=self.amounts[positions],
+            amount_floats=self.amount_floats[positions],
+            amount_valid=self.amount_valid[positions],
+            cents=None if self.cents is None else self.cents[positions],
+            date_ns=self.date_ns[positions],
+            date_days=None if self.date_days is None else self.date_days[positions],
+            date_valid=self.date_valid[positions],
+            desc_codes=self.desc_codes[positions],
+            first_two=None if self.first_two is None else self.first_two[positions],
+            has_desc=self.has_desc[positions],
+        )
+
+
+def _amount_band_pairs(
+    lower: np.ndarray, upper: np.ndarray, target: _ScoringColumns
+) -> tuple[np.ndarray, np.ndarray]:
+    """(source, target) pairs whose target amount lies in the source's band.
+
+    Targets are sorted by amount once and each source's band is located with
+    searchsorted, so only targets near the band are ever compared instead of
+    the full source x target grid. Those candidates are compared in float64,
+    and pairs within rounding distance of a bound are re-checked against the
+    original target value, so Decimal amounts are compared exactly against
+    the float bounds. Missing target amounts are never excluded.
+
+    Args:
+        lower: Lower amount bound per source row
+        upper: Upper amount bound per source row
+        target: Target scoring columns
+
+    Returns:
+        Tuple of (pair_source, pair_target) row positions in source-major,
+        then target order
+    """
+    floats = target.amount_floats
+    missing = np.flatnonzero(np.isnan(floats))
+    # argsort puts missing amounts last; only the present prefix is searched
+    by_amount = np.argsort(floats, kind="stable")[: len(floats) - len(missing)]
+    sorted_floats = floats[by_amount]
+    # Widen each band past the near-bound tolerance below so searchsorted
+    # never drops a pair the exact re-check would keep
+    start = np.searchsorted(sorted_floats, lower - np.abs(lower) * 1e-11, side="left")
+    stop = np.searchsorted(sorted_floats, upper + np.abs(upper) * 1e-11, side="right")
+    counts = np.maximum(stop - start, 0)
+    if not missing.size and not counts.any():
+        # No source has a viable target: skip pair expansion and re-checks
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    pair_source = np.concatenate(
+        [np.repeat(np.arange(len(lower)), counts), np.repeat(np.arange(len(lower)), len(missing))]
+    )
+    pair_target = np.concatenate(
+        [by_amount[np.repeat(start, counts) + offsets], np.tile(missing, len(lower))]
+    )
+
+    pair_floats = floats[pair_target]
+    pair_lower = lower[pair_source]
+    pair_upper = upper[pair_source]
+    outside = (pair_floats < pair_lower) | (pair_floats > pair_upper)
+    # Same test as np.isclose(rtol=1e-12, atol=0), without its generic
+    # broadcasting and non-finite handling
+    near_bound = (np.abs(pair_floats - pair_lower) <= np.abs(pair_lower) * 1e-12) | (
+        np.abs(pair_floats - pair_upper) <= np.abs(pair_upper) * 1e-12
+    )
+    for k in np.flatnonzero(near_bound):
+        t = pair_target[k]
+        value = target.amounts[t]
+        outside[k] = target.amount_valid[t] and (value < pair_lower[k] or value > pair_upper[k])
+    # Restore source-major, then target order by sorting one int64 key per
+    # pair (much cheaper than a lexsort over two arrays)
+    inside = ~outside
+    pair_keys = pair_source[inside].astype(np.int64) * len(floats) + pair_target[inside]
+    pair_keys.sort()
+    pair_source, pair_target = np.divmod(pair_keys, len(floats))
+    return pair_source, pair_target
+
+
+def _amount_pair_scores(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    tolerance: Decimal,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Amount score and exact-equality flag for each candidate pair.
+
+    Uses int64 cents when every amount converts exactly, otherwise exact
+    Decimal arithmetic on object arrays.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        tolerance: Maximum absolute difference scoring as an amount match
+
+    Returns:
+        Tuple of (amount_score, exact) arrays aligned with the pairs
+    """
+    if source.cents is not None and target.cents is not None:
+        diff = np.abs(source.cents[pair_source] - target.cents[pair_target])
+        within = diff <= _tolerance_cents(tolerance)
+    else:
+        diff = np.abs(source.amounts[pair_source] - target.amounts[pair_target])
+        within = (diff <= tolerance).astype(bool)
+    valid = source.amount_valid[pair_source] & target.amount_valid[pair_target]
+    exact = valid & (diff == 0).astype(bool)
+    return (within & valid).astype(np.float64), exact
+
+
+def _pair_days_apart(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+) -> np.ndarray:
+    """Absolute whole days between the dates of each pair.
+
+    Day differences are int32 day numbers when every date is at midnight,
+    otherwise int64 nanosecond differences floored like timedelta.days.
+    Values for pairs with a missing date are meaningless; mask with date_valid.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+
+    Returns:
+        Integer array aligned with the pairs
+    """
+    if source.date_days is not None and target.date_days is not None:
+        # Dates without a time of day: whole-day numbers subtract exactly
+        days_diff: np.ndarray = source.date_days[pair_source]
+        days_diff -= target.date_days[pair_target]
+    else:
+        days_diff = source.date_ns[pair_source]
+        days_diff -= target.date_ns[pair_target]
+        np.floor_divide(days_diff, _DAY_NS, out=days_diff)
+    np.abs(days_diff, out=days_diff)
+    return days_diff
+
+
+def _date_pair_scores(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    window: int,
+) -> np.ndarray:
+    """Date proximity score for each candidate pair.
+
+    Day differences come from _pair_days_apart.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        window: Date window in days
+
+    Returns:
+        Float array aligned with the pairs
+    """
+    days_diff = _pair_days_apart(source, target, pair_source, pair_target)
+    # 1.0 on the same day, falling linearly to 0.0 at the window edge and
+    # beyond; computed in place as 1.0 + days / -window, which rounds exactly
+    # like 1.0 - days / window
+    date_score: np.ndarray = days_diff.astype(np.float64)
+    date_score /= -max(window, 1)
+    date_score += 1.0
+    np.maximum(date_score, 0.0, out=date_score)
+    date_score[~(source.date_valid[pair_source] & target.date_valid[pair_target])] = 0.0
+    return date_score
+
+
+def _compact_codes(codes: np.ndarray, n_codes: int) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct codes in use and each element's position among them.
+
+    Codes are dense in range(n_codes), so a presence mask and its running
+    count replace the sort behind np.unique plus a searchsorted per element.
+
+    Args:
+        codes: Description codes, each in range(n_codes)
+        n_codes: Size of the code space
+
+    Returns:
+        Tuple of (sorted distinct codes, index of each element's code in them)
+    """
+    present = np.zeros(n_codes, dtype=bool)
+    present[codes] = True
+    rank = np.cumsum(present) - 1
+    return np.flatnonzero(present), rank[codes]
+
+
+def _description_pair_scores(
+    source_codes: np.ndarray,
+    target_codes: np.ndarray,
+    vocab: list[str],
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    score_cutoff: float | None = None,
+) -> np.ndarray:
+    """Description similarity (0-1) for each candidate pair.
+
+    Scores the distinct canonical descriptions that occur in the pairs with
+    one rapidfuzz cdist call, then gathers each pair's score by code.
+    Similarities below score_cutoff (0-100) come back as 0.0.
+
+    Args:
+        source_codes: Canonical description code per source row
+        target_codes: Canonical description code per target row
+        vocab: Canonical description for each code
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        score_cutoff: Optional minimum fuzz.ratio worth computing exactly
+
+    Returns:
+        Float array aligned with the pairs
+    """
+    pair_source_codes = source_codes[pair_source]
+    pair_target_codes = target_codes[pair_target]
+    source_used, source_rows = _compact_codes(pair_source_codes, len(vocab))
+    target_used, target_columns = _compact_codes(pair_target_codes, len(vocab))
+    similarity = process.cdist(
+        [vocab[code] for code in source_used.tolist()],
+        [vocab[code] for code in target_used.tolist()],
+        scorer=fuzz.ratio,
+        dtype=np.float64,
+        workers=-1,
+        score_cutoff=score_cutoff,
+    )
+    desc_score: np.ndarray = similarity[source_rows, target_columns] / 100.0
+    desc_score[pair_source_codes == pair_target_codes] = 1.0
+    return desc_score
+
+
+def _raw_description_similarities(
+    source_descs: pd.Series,
+    target_descs: pd.Series,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+) -> np.ndarray:
+    """fuzz.ratio of the raw descriptions of each pair, as calculate_reason scores them.
+
+    Args:
+        source_descs: Source description_clean column
+        target_descs: Target description_clean column
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+
+    Returns:
+        Float array (0-100) aligned with the pairs
+    """
+    if len(pair_source) == 0:
+        return np.zeros(0, dtype=np.float64)
+    # Missing descriptions get their own code; calculate_reason ignores those pairs
+    source_codes, source_uniques = pd.factorize(
+        source_descs.iloc[pair_source].astype(object), use_na_sentinel=False
+    )
+    target_codes, target_uniques = pd.factorize(
+        target_descs.iloc[pair_target].astype(object), use_na_sentinel=False
+    )
+    # Accepted matches are one-to-one, so the pairs are a sparse subset of the
+    # description cross product: score each distinct pair once, element-wise
+    code_pairs, inverse = np.unique(
+        source_codes.astype(np.int64) * len(target_uniques) + target_codes, return_inverse=True
+    )
+    source_strings = [str(value) for value in source_uniques]
+    target_strings = [str(value) for value in target_uniques]
+    similarity = process.cpdist(
+        [source_strings[code] for code in (code_pairs // len(target_uniques)).tolist()],
+        [target_strings[code] for code in (code_pairs % len(target_uniques)).tolist()],
+        scorer=fuzz.ratio,
+        dtype=np.float64,
+        workers=-1,
+    )
+    return np.asarray(similarity[inverse], dtype=np.float64)
+
+
+def _score_pairs(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    config: MatchConfig,
+    vocab: list[str],
+    intelligent_match: bool = False,
+    min_confidence: float | None = None,
+) -> np.ndarray:
+    """Confidence for each candidate pair, as calculate_confidence would compute it.
+
+    When intelligent_match is set, intelligent matches (exact amount and same
+    first two canonical words, as _check_intelligent_match) score 0.90 from a
+    pure array comparison, and only the remaining pairs go through the
+    weighted score (see _weighted_pair_scores).
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        config: Matching configuration
+        vocab: Canonical description for each code
+        intelligent_match: Apply the intelligent match (needs first_two codes
+            on both column sets)
+        min_confidence: Optional score below which pairs are not needed
+
+    Returns:
+        Confidence array aligned with the pairs
+    """
+    amount_score, exact_amount = _amount_pair_scores(
+        source, target, pair_source, pair_target, config.amount_tolerance
+    )
+    if intelligent_match and source.first_two is not None and target.first_two is not None:
+        source_first_two = source.first_two[pair_source]
+        intelligent = (
+            exact_amount
+            & (source_first_two >= 0)
+            & (source_first_two == target.first_two[pair_target])
+        )
+        if intelligent.any():
+            scored = ~intelligent
+            confidence = np.full(len(pair_source), 0.90)
+            if scored.any():
+                confidence[scored] = _weighted_pair_scores(
+                    source,
+                    target,
+                    pair_source[scored],
+                    pair_target[scored],
+                    amount_score[scored],
+                    config,
+                    vocab,
+                    min_confidence,
+                )
+            return confidence
+
+    return _weighted_pair_scores(
+        source, target, pair_source, pair_target, amount_score, config, vocab, min_confidence
+    )
+
+
+def _weighted_pair_scores(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    amount_score: np.ndarray,
+    config: MatchConfig,
+    vocab: list[str],
+    min_confidence: float | None,
+) -> np.ndarray:
+    """Weighted amount/date/description confidence of each pair.
+
+    When min_confidence is given, pairs that could not reach it even with
+    identical descriptions score 0.0 without running the fuzzy description
+    comparison.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        amount_score: Amount score of each pair (see _amount_pair_scores)
+        config: Matching configuration
+        vocab: Canonical description for each code
+        min_confidence: Optional score below which pairs are not needed
+
+    Returns:
+        Confidence array aligned with the pairs
+    """
+    date_score = _date_pair_scores(
+        source, target, pair_source, pair_target, config.date_window_days
+    )
+    if min_confidence is not None:
+        # Upper bound with a perfect description score; rounding is monotonic,
+        # so a pair whose rounded bound misses min_confidence can never reach it.
+        # Rounding moves a score by at most 0.00005, so only bounds within
+        # 0.0001 of min_confidence need the exact rounding
+        upper_bound = (amount_score * 0.3) + (date_score * 0.3) + 0.4
+        reachable = upper_bound >= min_confidence
+        near = np.abs(upper_bound - min_confidence) < 1e-4
+        if near.any():
+            reachable[near] = _round_confidence(upper_bound[near]) >= min_confidence
+        if not reachable.all():
+            confidence = np.zeros(len(pair_source))
+            if reachable.any():
+                confidence[reachable] = _combined_pair_scores(
+                    source,
+                    target,
+                    pair_source[reachable],
+                    pair_target[reachable],
+                    amount_score[reachable],
+                    date_score[reachable],
+                    vocab,
+                    min_confidence,
+                )
+            return confidence
+
+    return _combined_pair_scores(
+        source, target, pair_source, pair_target, amount_score, date_score, vocab, min_confidence
+    )
+
+
+def _combined_pair_scores(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    amount_score: np.ndarray,
+    date_score: np.ndarray,
+    vocab: list[str],
+    min_confidence: float | None,
+) -> np.ndarray:
+    """Add the description score to the amount and date scores and round.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        amount_score: Amount score of each pair
+        date_score: Date score of each pair (overwritten)
+        vocab: Canonical description for each code
+        min_confidence: Optional score below which pairs are not needed
+
+    Returns:
+        Confidence array aligned with the pairs
+    """
+    # Description similarity that even the best amount and date scores here
+    # need to reach min_confidence; rapidfuzz can reject anything below it
+    # early (those pairs score 0.0 but are dropped either way)
+    score_cutoff = None
+    if min_confidence is not None and len(pair_source):
+        best_partial = float(((amount_score * 0.3) + (date_score * 0.3)).max())
+        required = (min_confidence - best_partial - 1e-4) / 0.4 * 100
+        if required > 0:
+            score_cutoff = required
+    desc_score = _description_pair_scores(
+        source.desc_codes, target.desc_codes, vocab, pair_source, pair_target, score_cutoff
+    )
+    desc_score[~(source.has_desc[pair_source] & target.has_desc[pair_target])] = 0.0
+
+    # Weighted combination, accumulated in place (same operation order as
+    # calculate_confidence, so the floats are identical)
+    confidence = np.multiply(amount_score, 0.3)
+    confidence += np.multiply(date_score, 0.3, out=date_score)
+    confidence += np.multiply(desc_score, 0.4, out=desc_score)
+
+    return _round_confidence(confidence)
+
+
+def calculate_confidence_batch(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    config: MatchConfig,
+    alias_db: Any | None = None,
+) -> np.ndarray:
+    """Calculate confidence scores for every (source, target) pair at once.
+
+    Produces the same values as calling calculate_confidence on each pair,
+    but vectorizes the amount and date checks and scores all description
+    pairs with a single rapidfuzz cdist call over the distinct canonical
+    descriptions.
+
+    Args:
+        source_df: Normalized source DataFrame
+        target_df: Normalized target DataFrame
+        config: Matching configuration
+        alias_db: Optional AliasDatabase; when provided, descriptions are
+            resolved to primary name before comparison.
+
+    Returns:
+        Float array of shape (len(source_df), len(target_df)) where entry
+        [i, j] is the confidence of source row i against target row j
+    """
+    source_codes, target_codes, vocab = _intern_descriptions(
+        source_df["description_clean"], target_df["description_clean"], alias_db
+    )
+    pair_source, pair_target = (
+        grid.ravel() for grid in np.indices((len(source_df), len(target_df)))
+    )
+    confidence = _score_pairs(
+        _ScoringColumns.from_frame(source_df, source_codes),
+        _ScoringColumns.from_frame(target_df, target_codes),
+        pair_source,
+        pair_target,
+        config,
+        vocab,
+    )
+    return confidence.reshape(len(source_df), len(target_df))
+
+
 def classify_confidence_tier(confidence: float) -> ConfidenceTier:
     """Classify confidence score into tier.
 
@@ -278,54 +1086,269 @@ def classify_confidence_tier(confidence: float) -> ConfidenceTier:
         return ConfidenceTier.NONE
 
 
-def calculate_reason(source: Any, target: Any) -> str:
+# Lower bounds of the LOW, MEDIUM and HIGH tiers (see classify_confidence_tier)
+_TIER_BOUNDS = np.array([0.1, 0.5, 0.9])
+_TIERS_BY_BIN = (
+    ConfidenceTier.NONE,
+    ConfidenceTier.LOW,
+    ConfidenceTier.MEDIUM,
+    ConfidenceTier.HIGH,
+)
+
+
+def _classify_confidence_tiers(confidences: np.ndarray) -> list[ConfidenceTier]:
+    """Classify many confidence scores at once, as classify_confidence_tier.
+
+    Args:
+        confidences: Float array of confidence scores
+
+    Returns:
+        ConfidenceTier for each score, in input order
+    """
+    return [_TIERS_BY_BIN[bin_idx] for bin_idx in np.digitize(confidences, _TIER_BOUNDS).tolist()]
+
+
+def _reason_from_scores(
+    amount_equal: bool | None, days_diff: int | None, description_similarity: float | None
+) -> str:
+    """Format the reason string from already-computed comparisons.
+
+    Args:
+        amount_equal: Whether the amounts are equal, None if either is missing
+        days_diff: Absolute days between the dates, None if either is missing
+        description_similarity: fuzz.ratio of the raw descriptions (0-100),
+            None if either is missing
+
+    Returns:
+        Human-readable reason string
+    """
+    reasons = []
+
+    # Amount match
+    if amount_equal is not None:
+        reasons.append("exact amount" if amount_equal else "different amount")
+
+    # Date match
+    if days_diff is not None:
+        reasons.append("same date" if days_diff == 0 else f"{days_diff} days apart")
+
+    # Description match
+    if description_similarity is not None:
+        if description_similarity >= 95:
+            reasons.append("nearly identical description")
+        elif description_similarity >= 80:
+            reasons.append("similar description")
+        else:
+            reasons.append("different description")
+
+    return ", ".join(reasons)
+
+
+def calculate_reason(
+    source: Any, target: Any, *, description_similarity: float | None = None
+) -> str:
     """Generate human-readable explanation of match quality.
 
     Args:
         source: Source record (Series or namedtuple from itertuples)
         target: Target record (Series or namedtuple from itertuples)
+        description_similarity: Precomputed fuzz.ratio of the two raw
+            descriptions (0-100), e.g. from a batched cdist; computed here if None
 
     Returns:
         Human-readable reason string
     """
-    reasons = []
-
     # Amount match
+    amount_equal = None
     source_amount = _get_row_field(source, "amount_clean")
     target_amount = _get_row_field(target, "amount_clean")
-    if pd.notna(source_amount) and pd.notna(target_amount):
-        if abs(source_amount - target_amount) == 0:
-            reasons.append("exact amount")
-        else:
-            reasons.append("different amount")
+    if not _is_missing(source_amount) and not _is_missing(target_amount):
+        amount_equal = abs(source_amount - target_amount) == 0
 
     # Date match
+    days_diff = None
     source_date = _get_row_field(source, "date_clean")
     target_date = _get_row_field(target, "date_clean")
-    if pd.notna(source_date) and pd.notna(target_date):
+    if not _is_missing(source_date) and not _is_missing(target_date):
         days_diff = abs((source_date - target_date).days)
-        if days_diff == 0:
-            reasons.append("same date")
-        elif days_diff <= 3:
-            reasons.append(f"{days_diff} days apart")
-        else:
-            reasons.append(f"{days_diff} days apart")
 
     # Description match
+    similarity = None
     source_desc = _get_row_field(source, "description_clean")
     target_desc = _get_row_field(target, "description_clean")
-    if pd.notna(source_desc) and pd.notna(target_desc):
-        source_desc_str = str(source_desc)
-        target_desc_str = str(target_desc)
-        similarity = fuzz.ratio(source_desc_str, target_desc_str)
-        if similarity >= 95:
-            reasons.append("nearly identical description")
-        elif similarity >= 80:
-            reasons.append("similar description")
-        else:
-            reasons.append("different description")
+    if not _is_missing(source_desc) and not _is_missing(target_desc):
+        similarity = (
+            description_similarity
+            if description_similarity is not None
+            else fuzz.ratio(str(source_desc), str(target_desc))
+        )
 
-    return ", ".join(reasons)
+    return _reason_from_scores(amount_equal, days_diff, similarity)
+
+
+def _descending_order(confidence: np.ndarray) -> np.ndarray:
+    """Stable descending order of confidence scores.
+
+    Scores from the matcher are rounded to 4 places, so each one is an exact
+    number of 0.0001 steps and fits a uint16 key, which NumPy's stable sort
+    handles with a radix sort. Any other scores use a float argsort.
+
+    Args:
+        confidence: Confidence of each candidate pair
+
+    Returns:
+        Positions ordered by descending confidence, ties in input order
+    """
+    steps = np.rint(confidence * 10_000)
+    if (
+        len(confidence)
+        and np.array_equal(steps / 10_000, confidence)
+        and steps.min() >= 0
+        and steps.max() <= 10_000
+    ):
+        return np.argsort((10_000 - steps).astype(np.uint16), kind="stable")
+    return np.argsort(-confidence, kind="stable")
+
+
+# Sorted candidates examined per vectorized step of the greedy assignment
+_GREEDY_BLOCK = 4096
+
+
+def _greedy_assign(
+    confidence: np.ndarray,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    n_source: int,
+    n_target: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pick one-to-one matches greedily, highest confidence first.
+
+    Candidates are visited in a stable descending sort of their confidence,
+    so ties keep their input order, and a candidate is taken only if neither
+    its source nor its target has been used yet.
+
+    Args:
+        confidence: Confidence of each candidate pair
+        pair_source: Source row position of each pair
+        pair_target: Target row position of each pair
+        n_source: Number of source rows
+        n_target: Number of target rows
+
+    Returns:
+        Positions of the chosen candidates, in the order they were chosen,
+        and the boolean masks of matched source and target rows
+    """
+    order = _descending_order(confidence)
+    sorted_source = pair_source[order]
+    sorted_target = pair_target[order]
+    used_source = np.zeros(n_source, dtype=bool)
+    used_target = np.zeros(n_target, dtype=bool)
+    limit = min(n_source, n_target)
+    chosen: list[int] = []
+    # Walk the sorted candidates in blocks: rows already used before a block
+    # starts are masked out in one vectorized step, so the Python loop only
+    # visits candidates that may still be taken, and the walk stops early
+    # without converting the rest of the order to lists
+    for start in range(0, len(order), _GREEDY_BLOCK):
+        stop = start + _GREEDY_BLOCK
+        block_source = sorted_source[start:stop]
+        block_target = sorted_target[start:stop]
+        open_pairs = np.flatnonzero(~used_source[block_source] & ~used_target[block_target])
+        for candidate, source_idx, target_idx in zip(
+            order[start:stop][open_pairs].tolist(),
+            block_source[open_pairs].tolist(),
+            block_target[open_pairs].tolist(),
+            strict=True,
+        ):
+            if used_source[source_idx] or used_target[target_idx]:
+                continue
+            chosen.append(candidate)
+            used_source[source_idx] = True
+            used_target[target_idx] = True
+        if len(chosen) == limit:
+            break
+    return np.asarray(chosen, dtype=np.intp), used_source, used_target
+
+
+# fuzz.ratio thresholds of the "similar" and "nearly identical" reasons, and
+# a representative similarity for each band (see _reason_from_scores)
+_REASON_SIMILARITY_BANDS = np.array([80.0, 95.0])
+_REASON_SIMILARITY_BANDS_START = (0.0, 80.0, 95.0)
+
+
+def _match_reasons(
+    source: _ScoringColumns,
+    target: _ScoringColumns,
+    pair_source: np.ndarray,
+    pair_target: np.ndarray,
+    similarities: np.ndarray,
+) -> list[str]:
+    """calculate_reason for every accepted match, from the scoring columns.
+
+    Amount equality, day differences and description bands are computed for
+    all pairs at once, and each distinct reason string is formatted once.
+
+    Args:
+        source: Source scoring columns
+        target: Target scoring columns
+        pair_source: Source row position of each match
+        pair_target: Target row position of each match
+        similarities: Raw-description fuzz.ratio of each match (see
+            _raw_description_similarities)
+
+    Returns:
+        Reason string of each match
+    """
+    if source.cents is not None and target.cents is not None:
+        amount_equal = source.cents[pair_source] == target.cents[pair_target]
+    else:
+        amount_equal = np.asarray(
+            (source.amounts[pair_source] - target.amounts[pair_target]) == 0, dtype=bool
+        )
+    amount_valid = source.amount_valid[pair_source] & target.amount_valid[pair_target]
+    days_diff = _pair_days_apart(source, target, pair_source, pair_target)
+    date_valid = source.date_valid[pair_source] & target.date_valid[pair_target]
+    desc_valid = source.has_desc[pair_source] & target.has_desc[pair_target]
+
+    # Encode each reason as one int: amount (missing/equal/different), day
+    # difference (-1 when missing) and description band (missing, below 80,
+    # 80-95, 95+). Equal codes give equal strings, so each distinct reason is
+    # formatted once and gathered back.
+    amount_code = np.where(amount_valid, np.where(amount_equal, 1, 2), 0)
+    days_code = np.where(date_valid, days_diff, -1).astype(np.int64) + 1
+    desc_code = np.where(desc_valid, np.digitize(similarities, _REASON_SIMILARITY_BANDS) + 1, 0)
+    codes, inverse = np.unique(days_code * 12 + amount_code * 4 + desc_code, return_inverse=True)
+    reasons = [
+        _reason_from_scores(
+            (None, True, False)[code // 4 % 3],
+            code // 12 - 1 if code // 12 else None,
+            (None, *_REASON_SIMILARITY_BANDS_START)[code % 4],
+        )
+        for code in codes.tolist()
+    ]
+    return [reasons[index] for index in inverse.tolist()]
+
+
+def _unmatched_labels(index: pd.Index, matched: np.ndarray) -> list[Any]:
+    """Sorted index labels that are not among the matched row positions.
+
+    Matches record row positions while the missing lists report index labels,
+    which are the same thing for the default RangeIndex. That case reads the
+    unmatched positions straight off the mask; any other index compares its
+    labels against the matched positions.
+
+    Args:
+        index: Index of the source or target DataFrame
+        matched: Boolean mask of matched row positions
+
+    Returns:
+        Sorted list of distinct unmatched labels
+    """
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        return np.flatnonzero(~matched).tolist()
+    labels = index.to_numpy()
+    missing: list[Any] = np.unique(labels[~np.isin(labels, np.flatnonzero(matched))]).tolist()
+    return missing
 
 
 def find_matches(
@@ -349,8 +1372,9 @@ def find_matches(
     - Processes in order: add match if both source and target still unmatched
     - Tracks matched sources and targets to prevent reuse (handles duplicate transactions)
 
-    Performance optimization: Pre-calculates vectorized amount bounds (±amount_tolerance)
-    to skip expensive fuzzy matching for pairs where amount difference exceeds tolerance.
+    Performance optimization: Candidate pairs come from a vectorized amount-band mask
+    (±amount_tolerance) instead of a nested Python loop, and all candidates are scored
+    in bulk with NumPy and one rapidfuzz cdist call (see _score_pairs).
 
     Args:
         source_df: Normalized source DataFrame
@@ -363,8 +1387,6 @@ def find_matches(
         MatchResult with matches categorized by tier
     """
     matches: list[Match] = []
-    matched_sources: set[int] = set()
-    matched_targets: set[int] = set()
 
     # Early return for empty DataFrames or missing columns
     if len(source_df) == 0 or len(target_df) == 0:
@@ -396,88 +1418,91 @@ def find_matches(
     # Filter targets to only those within the global amount range
     target_amounts = np.asarray(target_df["amount_clean"].astype(float), dtype=np.float64)
     target_mask = (target_amounts >= global_lower) & (target_amounts <= global_upper)
-    filtered_target_df = target_df[target_mask].copy()
-    filtered_to_original_indices = np.where(target_mask)[0].tolist()
+    filtered_to_original_indices = np.flatnonzero(target_mask)
 
     # If no targets pass the amount filter, return early
-    if len(filtered_target_df) == 0:
+    if len(filtered_to_original_indices) == 0:
         return MatchResult(
             matches=[],
             missing_in_target=list(range(len(source_df))),
             missing_in_source=list(range(len(target_df))),
         )
 
-    # OPTIMIZATION: Pre-compute canonical descriptions to avoid repeated alias DB queries
-    # and string normalization in the nested loop
-    source_canonical_descs = [
-        _description_for_matching(
-            str(row.description_clean) if pd.notna(row.description_clean) else "", alias_db
-        )
-        for row in source_df.itertuples(index=False)
-    ]
-    target_canonical_descs = [
-        _description_for_matching(
-            str(row.description_clean) if pd.notna(row.description_clean) else "", alias_db
-        )
-        for row in filtered_target_df.itertuples(index=False)
-    ]
+    # Intern canonical descriptions as int32 codes shared by source and target:
+    # each distinct raw description hits the alias DB once, and the intelligent
+    # match compares first-two-word codes instead of strings.
+    source_desc_codes, target_desc_codes, desc_vocab = _intern_descriptions(
+        source_df["description_clean"], target_df["description_clean"], alias_db
+    )
+    first_two_codes = _first_two_word_codes(desc_vocab)
 
-    # Collect ALL (source, target) pairs with confidence >= min_confidence
-    candidate_pairs: list[tuple[float, int, int]] = []
-
-    # Use itertuples() for faster iteration (returns namedtuples instead of Series)
-    for source_idx, source_row in enumerate(source_df.itertuples(index=False)):
-        source_lower = source_amount_lower[source_idx]
-        source_upper = source_amount_upper[source_idx]
-        source_canonical = source_canonical_descs[source_idx]
-        source_first_two = (
-            _get_first_two_words(source_canonical) if len(source_canonical.split()) >= 2 else None
-        )
+    # Struct-of-arrays views of both sides, converted once for every step below;
+    # the prefiltered targets are gathered from the arrays, never from a copy
+    # of the DataFrame
+    source_scoring = _ScoringColumns.from_frame(
+        source_df, source_desc_codes, source_amounts, first_two_codes
+    )
+    filtered_target_scoring = _ScoringColumns.from_frame(
+        target_df, target_desc_codes, target_amounts, first_two_codes
+    ).take(filtered_to_original_indices)
+
+    # Candidate generation: every (source, target) pair inside the source's amount
+    # band, in source-major order (the order the greedy pass breaks ties by)
+    pair_source, pair_filtered = _amount_band_pairs(
+        source_amount_lower, source_amount_upper, filtered_target_scoring
+    )
 
-        for filtered_idx, target_row in enumerate(filtered_target_df.itertuples(index=False)):
-            target_amount = target_row.amount_clean
-            if pd.notna(target_amount) and (
-                target_amount < source_lower or target_amount > source_upper
-            ):
-                continue
+    # Score all candidates at once; intelligent matches (exact amount and same
+    # first two words) take 0.90 without running the weighted score
+    confidences = _score_pairs(
+        source_scoring,
+        filtered_target_scoring,
+        pair_source,
+        pair_filtered,
+        config,
+        desc_vocab,
+        intelligent_match=True,
+        min_confidence=min_confidence,
+    )
 
-            intelligent_confidence = None
-            source_amt = _get_row_field(source_row, "amount_clean")
-            target_amt = _get_row_field(target_row, "amount_clean")
-
-            if (
-                pd.notna(source_amt)
-                and pd.notna(target_amt)
-                and source_amt == target_amt
-                and source_first_two is not None
-            ):
-                target_canonical = target_canonical_descs[filtered_idx]
-                if len(target_canonical.split()) >= 2:
-                    target_first_two = _get_first_two_words(target_canonical)
-                    if source_first_two == target_first_two:
-                        intelligent_confidence = 0.90
-
-            if intelligent_confidence is not None:
-                confidence = intelligent_confidence
-            else:
-                confidence = calculate_confidence(source_row, target_row, config, alias_db=alias_db)
-
-            if confidence >= min_confidence:
-                target_idx = int(filtered_to_original_indices[filtered_idx])
-                candidate_pairs.append((confidence, source_idx, target_idx))
-
-    # Sort by confidence descending (greedy: highest confidence first)
-    candidate_pairs.sort(key=lambda x: x[0], reverse=True)
-
-    # Process in order: add match if both source and target still unmatched
-    for confidence, source_idx, target_idx in candidate_pairs:
-        if source_idx in matched_sources or target_idx in matched_targets:
-            continue
-
-        source_row = source_df.iloc[source_idx]
-        target_row = target_df.iloc[target_idx]
-
-        tier = classify_confidence_tier(confidence)
+    # Collect ALL (source, target) pairs with confidence >= min_confidence
+    keep = confidences >= min_confidence
+    candidate_confidence = confidences[keep]
+    candidate_source = pair_source[keep]
+    candidate_filtered = pair_filtered[keep]
+    candidate_target = filtered_to_original_indices[candidate_filtered]
+
+    # Greedy: highest confidence first, add match if both sides still unmatched
+    chosen, matched_source, matched_target = _greedy_assign(
+        candidate_confidence, candidate_source, candidate_target, len(source_df), len(target_df)
+    )
+    selected_source = candidate_source[chosen]
+    selected_target = candidate_target[chosen]
+    selected_confidence = candidate_confidence[chosen]
+
+    # Reasons come from the scoring columns plus one batched raw-description
+    # similarity per accepted match, not from a calculate_reason call per row
+    reasons = _match_reasons(
+        source_scoring,
+        filtered_target_scoring,
+        selected_source,
+        candidate_filtered[chosen],
+        _raw_description_similarities(
+            source_df["description_clean"],
+            target_df["description_clean"],
+            selected_source,
+            selected_target,
+        ),
+    )
+
+    for confidence, source_idx, target_idx, tier, reason in zip(
+        selected_confidence.tolist(),
+        selected_source.tolist(),
+        selected_target.tolist(),
+        _classify_confidence_tiers(selected_confidence),
+        reasons,
+        strict=True,
+    ):
         decision = MatchDecision.ACCEPTED if tier == ConfidenceTier.HIGH else MatchDecision.PENDING
 
         matches.append(
@@ -485,22 +1510,15 @@ def find_matches(
                 source_idx=source_idx,
                 target_idx=target_idx,
                 confidence=confidence,
-                reason=calculate_reason(source_row, target_row),
+                reason=reason,
                 tier=tier,
                 decision=decision,
             )
         )
 
-        matched_sources.add(source_idx)
-        matched_targets.add(target_idx)
-
-    # Find source records that weren't matched
-    all_source_indices = set(source_df.index)
-    missing_in_target = sorted(all_source_indices - matched_sources)
-
-    # Find target records that weren't matched
-    all_target_indices = set(target_df.index)
-    missing_in_source = sorted(all_target_indices - matched_targets)
+    # Records that weren't matched, read off the greedy pass's bitmasks
+    missing_in_target = _unmatched_labels(source_df.index, matched_source)
+    missing_in_source = _unmatched_labels(target_df.index, matched_target)
 
     return MatchResult(
         matches=matches,
@@ -574,6 +1592,7 @@ __all__ = [
     "MatchResult",
     "MatchConfig",
     "calculate_confidence",
+    "calculate_confidence_batch",
     "calculate_reason",
     "classify_confidence_tier",
     "find_matches",
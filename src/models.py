@@ -7,7 +7,7 @@ from enum import Enum, StrEnum
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnMapping:
     """Detected column mappings for a CSV.
 
@@ -47,7 +47,7 @@ class ConfidenceTier(StrEnum):
     NONE = "none"  # < 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedRecord:
     """Standardized transaction record.
 
@@ -64,7 +64,7 @@ class NormalizedRecord:
     original_idx: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a match between source and target records.
 
@@ -87,7 +87,7 @@ class Match:
     tier: ConfidenceTier = field(default_factory=lambda: ConfidenceTier.MEDIUM)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching operation.
 
@@ -104,7 +104,7 @@ class MatchResult:
     duplicate_matches: list[Match] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchConfig:
     """Configuration for matching algorithm.
 
@@ -121,7 +121,7 @@ class MatchConfig:
     amount_tolerance: Decimal = Decimal("0.10")  # 10% default for early-exit
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordEdit:
     """Tracks edits made to a record.
 
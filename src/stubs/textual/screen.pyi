@@ -9,6 +9,17 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from textual.app import App
 
+class WorkerManager:
+    """The app's registry of running workers."""
+
+    def cancel_group(self, node: Any, group: str) -> list[Any]:
+        """Cancel the workers a node started in the given group."""
+        ...
+
+    def cancel_all(self) -> None:
+        """Cancel all workers."""
+        ...
+
 class Screen:
     """A screen in the Textual TUI framework.
 
@@ -18,6 +29,37 @@ class Screen:
     # The app that owns this screen
     app: App[Any]
 
+    # The app's worker manager (shortcut for app.workers)
+    workers: WorkerManager
+
+    def run_worker(
+        self,
+        work: Any,
+        name: str | None = "",
+        group: str = "default",
+        description: str = "",
+        exit_on_error: bool = True,
+        start: bool = True,
+        exclusive: bool = False,
+        thread: bool = False,
+    ) -> Any:
+        """Run a coroutine or callable in a worker owned by this screen.
+
+        Args:
+            work: The coroutine, coroutine function or callable to run
+            name: A short name for the worker
+            group: Group name, used to cancel related workers together
+            description: A longer description of the worker
+            exit_on_error: Exit the app if the worker raises
+            start: Start the worker immediately
+            exclusive: Cancel other workers in the same group first
+            thread: Run the worker in a thread
+
+        Returns:
+            The new worker
+        """
+        ...
+
     def push_screen(self, screen: Screen) -> None:
         """Push a new screen onto the screen stack.
 
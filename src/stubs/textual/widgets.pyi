@@ -4,6 +4,7 @@ This stub file provides type hints for Textual's DataTable widget
 to improve type safety in the Double Post codebase.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 class DataTable:
@@ -28,6 +29,10 @@ class DataTable:
         """Add a row to the table."""
         ...
 
+    def add_rows(self, rows: Iterable[Iterable[Any]]) -> list[Any]:
+        """Add several rows to the table at once."""
+        ...
+
     def clear(self) -> None:
         """Clear all rows from the table."""
         ...
@@ -5,6 +5,8 @@ TUI screen classes to eliminate code duplication.
 """
 
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 
 import pandas as pd
 
@@ -22,7 +24,14 @@ def format_date(date_val) -> str:
     """
     if pd.isna(date_val):
         return "N/A"
-    return date_val.strftime("%Y-%m-%d")
+    # Aware timestamps compare equal across zones, so the zone is part of the key
+    return _format_date_cached(date_val, getattr(date_val, "tzinfo", None))
+
+
+@lru_cache(maxsize=8192)
+def _format_date_cached(date_val: Any, _tzinfo: Any) -> str:
+    """Memoized strftime for format_date; _tzinfo only widens the cache key."""
+    return str(date_val.strftime("%Y-%m-%d"))
 
 
 def format_amount(amount_val: Decimal) -> str:
@@ -36,6 +45,15 @@ def format_amount(amount_val: Decimal) -> str:
     """
     if pd.isna(amount_val):
         return "N/A"
+    if not amount_val:
+        # 0 and -0 share a cache key but not a rendering
+        return f"${Decimal(amount_val):.2f}"
+    return _format_amount_cached(amount_val)
+
+
+@lru_cache(maxsize=8192)
+def _format_amount_cached(amount_val: Any) -> str:
+    """Memoized Decimal conversion for format_amount; amounts repeat heavily."""
     amount = Decimal(amount_val)
     return f"${amount:.2f}"
 
@@ -53,6 +71,16 @@ def truncate_string(s: str, max_len: int) -> str:
     return s[:max_len] + "..." if len(s) > max_len else s
 
 
+# Built once at import instead of on every get_tier_display call
+_TIER_DISPLAY: dict[ConfidenceTier, tuple[str, str, str]] = {
+    ConfidenceTier.HIGH: ("HIGH", "⭐", "bold green"),
+    ConfidenceTier.MEDIUM: ("MED", "○", "yellow"),
+    ConfidenceTier.LOW: ("LOW", "○", "dim cyan"),
+    ConfidenceTier.NONE: ("NONE", "—", "dim"),
+}
+_UNKNOWN_TIER_DISPLAY = ("?", "?", "white")
+
+
 def get_tier_display(tier: ConfidenceTier) -> tuple[str, str, str]:
     """Get tier text, icon, and color markup for display.
 
@@ -65,13 +93,7 @@ def get_tier_display(tier: ConfidenceTier) -> tuple[str, str, str]:
         - icon: Symbol representing tier ("⭐", "○", "—")
         - color_markup: Textual markup color ("bold green", "yellow", etc.)
     """
-    tier_map = {
-        ConfidenceTier.HIGH: ("HIGH", "⭐", "bold green"),
-        ConfidenceTier.MEDIUM: ("MED", "○", "yellow"),
-        ConfidenceTier.LOW: ("LOW", "○", "dim cyan"),
-        ConfidenceTier.NONE: ("NONE", "—", "dim"),
-    }
-    return tier_map.get(tier, ("?", "?", "white"))
+    return _TIER_DISPLAY.get(tier, _UNKNOWN_TIER_DISPLAY)
 
 
 __all__ = ["format_date", "format_amount", "truncate_string", "get_tier_display"]
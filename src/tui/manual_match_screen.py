@@ -3,9 +3,13 @@
 Allows users to manually match an unmatched source record to a target record.
 """
 
+import asyncio
+from functools import partial
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz, process
 from textual.screen import Screen
 from textual.widgets import DataTable, Footer, Header, Static
 
@@ -23,8 +27,16 @@ class ManualMatchScreen(Screen):
         ("escape", "app.pop_screen", "Cancel"),
         ("q", "app.pop_screen", "Cancel"),
         ("enter", "confirm_match", "Confirm Match"),
+        ("a", "toggle_show_all", "Show All"),
     ]
 
+    # Best-scoring targets listed by default; "a" toggles the full list
+    TOP_K = 50
+
+    # Rows added while populating; the rest are streamed in ROW_BATCH chunks
+    INITIAL_ROWS = 50
+    ROW_BATCH = 200
+
     def __init__(
         self,
         source_df: pd.DataFrame,
@@ -46,6 +58,11 @@ class ManualMatchScreen(Screen):
         self.source_idx = source_idx
         self.match_result = match_result
         self.selected_target_idx: int | None = None
+        self.show_all = False
+        self._available_targets = np.empty(0, dtype=np.intp)
+        self._available = target_df.iloc[:0]
+        self._target_descs: list[str] = []
+        self._similarities = np.empty(0, dtype=np.float64)
 
     def compose(self) -> Any:
         """Compose the manual match screen."""
@@ -55,7 +72,8 @@ class ManualMatchScreen(Screen):
             id="title",
         )
         yield Static(
-            "[dim]Select a target record and press ENTER to confirm, ESC to cancel[/]",
+            "[dim]Select a target record and press ENTER to confirm, A to show all targets, "
+            "ESC to cancel[/]",
             id="help_text",
         )
 
@@ -79,27 +97,117 @@ class ManualMatchScreen(Screen):
         table.add_columns("Index", "Date", "Amount", "Description", "Similarity")
 
         # Get available targets
-        available_targets = self.get_available_targets()
+        self._available_targets = np.asarray(self.get_available_targets(), dtype=np.intp)
+
+        # Pull the available rows out once instead of building a row Series
+        # per target with iloc
+        self._available = self.target_df.iloc[self._available_targets]
+        descriptions = self._available["description_clean"]
+        if isinstance(descriptions.dtype, pd.StringDtype) and not descriptions.hasnans:
+            # Already all str; skip the per-row str() call
+            self._target_descs = descriptions.tolist()
+        else:
+            self._target_descs = [str(desc) for desc in descriptions.tolist()]
+
+        # Score the source description against every available target in
+        # one rapidfuzz call instead of one fuzz.ratio call per row
+        source_desc = str(self.get_source_record()["description_clean"])
+        self._similarities = (
+            process.cdist(
+                [source_desc],
+                self._target_descs,
+                scorer=fuzz.ratio,
+                dtype=np.float64,
+                workers=-1,
+            )[0]
+            / 100.0
+        )
 
-        # Add rows for each available target
-        for target_idx in available_targets:
-            target_row = self.target_df.iloc[target_idx]
-            source_row = self.source_df.iloc[self.source_idx]
+        self._populate_table()
 
-            # Calculate similarity (simple character match for now)
-            similarity = self._calculate_similarity(
-                str(source_row["description_clean"]),
-                str(target_row["description_clean"]),
-            )
+    def action_toggle_show_all(self) -> None:
+        """Switch between the top TOP_K targets and every available target."""
+        self.show_all = not self.show_all
+        self._populate_table()
+
+    def _display_order(self) -> np.ndarray:
+        """Positions (within the available targets) of the rows to show.
+
+        Returns:
+            Every position in target order when show_all is set, otherwise the
+            TOP_K most similar targets, best first (ties in target order)
+        """
+        n_available = len(self._similarities)
+        if self.show_all:
+            return np.arange(n_available)
+        if n_available > self.TOP_K:
+            # Linear-time selection of the TOP_K-th best score; targets tied
+            # with it are taken in target order so the cut is deterministic
+            cutoff = -np.partition(-self._similarities, self.TOP_K - 1)[self.TOP_K - 1]
+            above = np.flatnonzero(self._similarities > cutoff)
+            tied = np.flatnonzero(self._similarities == cutoff)[: self.TOP_K - len(above)]
+            top = np.union1d(above, tied)
+        else:
+            top = np.arange(n_available)
+        order: np.ndarray = top[np.argsort(-self._similarities[top], kind="stable")]
+        return order
+
+    def _format_rows(self, positions: np.ndarray) -> list[tuple[str, ...]]:
+        """Format the table cells for the given available-target positions.
+
+        Args:
+            positions: Positions within the available targets, in display order
+
+        Returns:
+            One tuple of cell strings per row
+        """
+        # Dates go through one vectorized strftime; the other columns are
+        # already plain Python values
+        shown = self._available.iloc[positions]
+        index_cells = [
+            str(target_idx) for target_idx in self._available_targets[positions].tolist()
+        ]
+        date_cells = shown["date_clean"].dt.strftime("%Y-%m-%d").fillna("N/A").tolist()
+        amount_cells = [f"${amount}" for amount in shown["amount_clean"].tolist()]
+        desc_cells = [self._target_descs[pos][:40] for pos in positions.tolist()]
+        similarity_cells = [
+            f"{similarity:.0%}" for similarity in self._similarities[positions].tolist()
+        ]
+        return list(
+            zip(index_cells, date_cells, amount_cells, desc_cells, similarity_cells, strict=True)
+        )
+
+    def _populate_table(self) -> None:
+        """Fill the targets table for the current view.
 
-            table.add_row(
-                str(target_idx),
-                target_row["date_clean"].strftime("%Y-%m-%d"),
-                f"${target_row['amount_clean']}",
-                str(target_row["description_clean"])[:40],
-                f"{similarity:.0%}",
+        The first screenful is added right away and the rest is streamed from
+        a worker, so a long target list does not hold up the first paint.
+        """
+        table = self.query_one("#targets_table", DataTable)
+        # Stop any rows still streaming in for the previous view
+        self.workers.cancel_group(self, "populate")
+        table.clear()
+
+        rows = self._format_rows(self._display_order())
+        table.add_rows(rows[: self.INITIAL_ROWS])
+        if len(rows) > self.INITIAL_ROWS:
+            self.run_worker(
+                partial(self._populate_remainder, table, rows[self.INITIAL_ROWS :]),
+                group="populate",
+                exclusive=True,
             )
 
+    async def _populate_remainder(self, table: DataTable, rows: list[tuple[str, ...]]) -> None:
+        """Add the rows left over after the first screenful, yielding between batches.
+
+        Args:
+            table: The targets table
+            rows: Formatted cells for each remaining row, in display order
+        """
+        for start in range(0, len(rows), self.ROW_BATCH):
+            table.add_rows(rows[start : start + self.ROW_BATCH])
+            await asyncio.sleep(0)
+
     def get_available_targets(self) -> list[int]:
         """Get list of available target indices.
 
@@ -108,19 +216,23 @@ class ManualMatchScreen(Screen):
         Returns:
             List of available target indices
         """
-        # Get all target indices
-        all_targets = list(range(len(self.target_df)))
+        n_targets = len(self.target_df)
 
         # If no match result, return all targets
         if self.match_result is None:
-            return all_targets
+            return list(range(n_targets))
 
-        # Filter out already-matched targets
-        matched_targets = {
-            m.target_idx for m in self.match_result.matches if m.target_idx is not None
-        }
-        available_targets = [idx for idx in all_targets if idx not in matched_targets]
+        # Clear already-matched targets in a boolean mask; indices outside the
+        # frame cannot be available anyway and are ignored
+        matched_targets = np.fromiter(
+            (m.target_idx for m in self.match_result.matches if m.target_idx is not None),
+            dtype=np.int64,
+        )
+        matched_targets = matched_targets[(matched_targets >= 0) & (matched_targets < n_targets)]
+        available = np.ones(n_targets, dtype=bool)
+        available[matched_targets] = False
 
+        available_targets: list[int] = np.flatnonzero(available).tolist()
         return available_targets
 
     def get_source_record(self) -> pd.Series:
@@ -136,20 +248,6 @@ class ManualMatchScreen(Screen):
             raise IndexError(f"Source index {self.source_idx} out of range")
         return self.source_df.iloc[self.source_idx]
 
-    def _calculate_similarity(self, source_desc: str, target_desc: str) -> float:
-        """Calculate description similarity score.
-
-        Args:
-            source_desc: Source description
-            target_desc: Target description
-
-        Returns:
-            Similarity score from 0.0 to 1.0
-        """
-        from rapidfuzz import fuzz
-
-        return fuzz.ratio(source_desc, target_desc) / 100.0
-
     def action_confirm_match(self) -> None:
         """Confirm the selected match.
 
@@ -4,7 +4,9 @@ Tests the main reconcile() function in src/main.py.
 """
 
 from pathlib import Path
+from typing import Any
 
+import pytest
 from typer.testing import CliRunner
 
 
@@ -181,3 +183,58 @@ class TestCLIFunctionality:
         assert "High confidence" in result.stdout or "≥0.8" in result.stdout
         assert "Medium confidence" in result.stdout or "0.6-0.8" in result.stdout
         assert "Low confidence" in result.stdout or "<0.6" in result.stdout
+
+    def test_dry_run_listing_is_chunk_size_independent(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that writing the dry-run listing in chunks does not change the output."""
+        import src.main
+        from src.main import app
+
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+
+        source = tmp_path / "source.csv"
+        target = tmp_path / "target.csv"
+        rows = "".join(f"2024-01-{day:02d},{day}.00,Shop {day}\n" for day in range(1, 29))
+        source.write_text("date,amount,description\n" + rows)
+        target.write_text("date,amount,description\n" + rows)
+
+        default = runner.invoke(app, [str(source), str(target), "--dry-run"])
+        monkeypatch.setattr(src.main, "_DRY_RUN_CHUNK_LINES", 1)
+        chunked = runner.invoke(app, [str(source), str(target), "--dry-run"])
+
+        assert default.exit_code == 0
+        assert chunked.exit_code == 0
+        assert chunked.stdout == default.stdout
+
+    def test_dry_run_listing_flushes_lines_before_an_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lines built before a formatting error are still printed."""
+        import src.main
+        from src.main import app
+        from src.models import Match
+
+        monkeypatch.chdir(tmp_path)
+        real_find_matches = src.main.find_matches
+
+        def find_matches_with_bad_row(*args: Any, **kwargs: Any) -> Any:
+            result = real_find_matches(*args, **kwargs)
+            # Out-of-range source row: formatting it raises partway through the listing
+            result.matches.append(Match(source_idx=99, target_idx=None, confidence=0.5, reason="x"))
+            return result
+
+        monkeypatch.setattr(src.main, "find_matches", find_matches_with_bad_row)
+        runner = CliRunner()
+
+        source = tmp_path / "source.csv"
+        target = tmp_path / "target.csv"
+        source.write_text("date,amount,description\n2024-01-15,100.00,Coffee\n")
+        target.write_text("date,amount,description\n2024-01-15,100.00,Coffee\n")
+
+        result = runner.invoke(app, [str(source), str(target), "--dry-run"])
+
+        assert isinstance(result.exception, IndexError)
+        assert "MATCHES (Source Amt → Target Amt)" in result.stdout
+        assert "coffee → coffee" in result.stdout
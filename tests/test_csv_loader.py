@@ -223,6 +223,16 @@ class TestCSVLoudAndNormalization:
         assert "date_clean" in df.columns
         assert "amount_clean" in df.columns
 
+    def test_load_csv_reads_only_needed_columns(self, fixtures_dir: Path):
+        """Test that unmapped columns are skipped but reconciled is kept."""
+        df, mapping, convention = load_csv(fixtures_dir / "personal.csv")
+
+        assert "reconciled" in df.columns
+        assert "custodian" not in df.columns
+        assert "tx_id" not in df.columns
+        assert mapping.date in df.columns
+        assert mapping.description in df.columns
+
     def test_normalize_dataframe_removes_invalid_rows(self):
         """Test that rows with unparseable dates/amounts are filtered."""
         import pandas as pd
@@ -249,6 +259,166 @@ class TestCSVLoudAndNormalization:
         # Should filter out rows with invalid data
         assert len(normalized) < len(df)
 
+    def test_normalize_dataframe_chase_amounts_match_standardize_amount(self):
+        """Test Chase Debit/Credit cells parse exactly like standardize_amount."""
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "Post Date": ["2024-01-15"] * 6,
+                "Description": ["A", "B", "C", "D", "E", "F"],
+                "Debit": ["15.99", None, "", "$1,234.56", "   ", " 7.50 "],
+                "Credit": [None, "200.00", "", None, None, None],
+            }
+        )
+        mapping = ColumnMapping(
+            date="Post Date",
+            amount=None,
+            description="Description",
+            debit="Debit",
+            credit="Credit",
+            type=None,
+            format_type="chase",
+        )
+
+        normalized = normalize_dataframe(df, mapping, {})
+
+        expected = [standardize_amount(row, mapping) for _, row in df.iterrows()]
+        assert expected == [
+            Decimal("-15.99"),
+            Decimal("200.00"),
+            Decimal(0),
+            None,
+            None,
+            Decimal("-7.50"),
+        ]
+        kept = [amount for amount in expected if amount is not None]
+        assert normalized["amount_clean"].tolist() == kept
+
+    def test_normalize_dataframe_signed_amounts_match_standardize_amount(self):
+        """Test single-column amounts are valid exactly when Decimal accepts them."""
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "date": ["2024-01-15"] * 5,
+                "amount": ["1_000", "$1,234.56", " -7.50 ", "12 34", "abc"],
+                "description": ["A", "B", "C", "D", "E"],
+            }
+        )
+        mapping = ColumnMapping(
+            date="date",
+            amount="amount",
+            description="description",
+            debit=None,
+            credit=None,
+            type=None,
+            format_type="generic",
+        )
+
+        normalized = normalize_dataframe(df, mapping, {})
+
+        expected = [standardize_amount(row, mapping) for _, row in df.iterrows()]
+        assert expected == [Decimal("1000"), Decimal("1234.56"), Decimal("-7.50"), None, None]
+        kept = [amount for amount in expected if amount is not None]
+        assert normalized["amount_clean"].tolist() == kept
+
+    def test_load_csv_parses_integer_yyyymmdd_dates(self, tmp_path: Path):
+        """Test that an unquoted YYYYMMDD column (read as int64) parses as dates."""
+        csv_path = tmp_path / "int_dates.csv"
+        csv_path.write_text(
+            "date,amount,description\n20240115,-10.00,Coffee\n20240201,-20.00,Lunch\n"
+        )
+
+        df, _, _ = load_csv(csv_path)
+
+        assert df["date_clean"].tolist() == [datetime(2024, 1, 15), datetime(2024, 2, 1)]
+
+    def test_normalize_dataframe_mixed_utc_offsets(self):
+        """Test that mixed UTC offsets parse to tz-naive local wall times."""
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "date": ["2024-01-15T10:00:00+01:00", "2024-01-16T10:00:00-05:00", "2024-01-17"],
+                "amount": ["10.00", "-5.00", "1.00"],
+                "description": ["A", "B", "C"],
+            }
+        )
+        mapping = ColumnMapping(
+            date="date",
+            amount="amount",
+            description="description",
+            debit=None,
+            credit=None,
+            type=None,
+            format_type="generic",
+        )
+
+        normalized = normalize_dataframe(df, mapping, {})
+
+        assert normalized["date_clean"].dt.tz is None
+        assert normalized["date_clean"].tolist() == [
+            datetime(2024, 1, 15, 10),
+            datetime(2024, 1, 16, 10),
+            datetime(2024, 1, 17),
+        ]
+
+    def test_normalize_dataframe_keeps_local_date_for_negative_offset(self):
+        """Test that a late-evening negative-offset timestamp keeps its local date."""
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "date": ["2024-01-05T23:00:00-05:00", "2024-01-05 23:30Z", "2024-01-06"],
+                "amount": ["-42.00", "-1.00", "-2.00"],
+                "description": ["Late dinner", "Snack", "Parking"],
+            }
+        )
+        mapping = ColumnMapping(
+            date="date",
+            amount="amount",
+            description="description",
+            debit=None,
+            credit=None,
+            type=None,
+            format_type="generic",
+        )
+
+        normalized = normalize_dataframe(df, mapping, {})
+
+        assert normalized["date_clean"].tolist() == [
+            datetime(2024, 1, 5, 23),
+            datetime(2024, 1, 5, 23, 30),
+            datetime(2024, 1, 6),
+        ]
+
+    def test_normalize_dataframe_description_string_dtype(self):
+        """Test that descriptions are stripped, lowercased and string-typed."""
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                "date": ["2024-01-15", "2024-01-16"],
+                "amount": ["10.00", "-5.00"],
+                "description": ["  NETFLIX.COM ", "Joe's Coffee"],
+            }
+        )
+        mapping = ColumnMapping(
+            date="date",
+            amount="amount",
+            description="description",
+            debit=None,
+            credit=None,
+            type=None,
+            format_type="generic",
+        )
+
+        normalized = normalize_dataframe(df, mapping, {})
+
+        assert isinstance(normalized["description_clean"].dtype, pd.StringDtype)
+        assert normalized["description_clean"].tolist() == ["netflix.com", "joe's coffee"]
+
 
 class TestSignConventionDetection:
     """Tests for automatic detection of expense sign convention."""
@@ -55,6 +55,14 @@ class TestInferDateFormatEdgeCases:
         # Should detect format even with two-digit years
         assert result is not None
 
+    def test_dmy_detected_beyond_first_ten_rows(self) -> None:
+        """Test that a disambiguating DMY date later in the sample is still found."""
+        dates = pd.Series(["01/02/2024"] * 20 + ["25/02/2024"])
+        result = infer_date_format(dates)
+
+        assert result["dayfirst"] is True
+        assert result["yearfirst"] is False
+
 
 class TestStandardizeAmountEdgeCases:
     """Test edge cases for amount standardization."""
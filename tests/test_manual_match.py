@@ -3,11 +3,14 @@
 Tests for creating manual matches between source and target records.
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pytest
+from textual.app import App
 
 from src.matcher import create_manual_match
 from src.models import Match, MatchDecision, MatchResult
@@ -194,6 +197,41 @@ class TestManualMatchScreen:
         # Target 0 should be filtered out
         assert 0 not in available_targets
 
+    def test_screen_ignores_out_of_range_matched_targets(self) -> None:
+        """Test that stale matched target indices do not affect availability."""
+        from src.tui.manual_match_screen import ManualMatchScreen
+
+        source_df = TestDataFactory.create_source_dataframe()
+        target_df = TestDataFactory.create_target_dataframe()
+
+        matches = [
+            TestDataFactory.create_match(source_idx=0, target_idx=1),
+            TestDataFactory.create_match(source_idx=1, target_idx=len(target_df) + 5),
+            TestDataFactory.create_match(source_idx=2, target_idx=-1),
+        ]
+        match_result = MatchResult(matches=matches, missing_in_target=[], duplicate_matches=[])
+
+        screen = ManualMatchScreen(source_df, target_df, 0, match_result)
+
+        expected = [idx for idx in range(len(target_df)) if idx != 1]
+        assert screen.get_available_targets() == expected
+
+    def test_screen_lists_top_targets_best_first(self) -> None:
+        """Test that the default view keeps the TOP_K best targets, ties in target order."""
+        from src.tui.manual_match_screen import ManualMatchScreen
+
+        source_df = TestDataFactory.create_source_dataframe()
+        target_df = TestDataFactory.create_target_dataframe()
+
+        screen = ManualMatchScreen(source_df, target_df, 0)
+        screen.TOP_K = 3
+        screen._similarities = np.array([0.2, 0.9, 0.5, 0.5, 0.1, 0.5])
+
+        assert screen._display_order().tolist() == [1, 2, 3]
+
+        screen.show_all = True
+        assert screen._display_order().tolist() == [0, 1, 2, 3, 4, 5]
+
     def test_screen_shows_source_record(self) -> None:
         """Test that screen displays the source record being matched."""
         from src.tui.manual_match_screen import ManualMatchScreen
@@ -358,3 +396,104 @@ class TestManualMatchEdgeCases:
         # Both should be created, but they have the same indices
         assert match1.source_idx == match2.source_idx
         assert match1.target_idx == match2.target_idx
+
+
+def _many_targets_dataframe(n_rows: int) -> pd.DataFrame:
+    """Target DataFrame with n_rows distinct records."""
+    return pd.DataFrame(
+        {
+            "date_clean": [datetime(2024, 1, 1) + timedelta(days=i % 60) for i in range(n_rows)],
+            "amount_clean": [Decimal(i) / 100 for i in range(n_rows)],
+            "description_clean": [f"merchant {i}" for i in range(n_rows)],
+        }
+    )
+
+
+class TestManualMatchScreenPilot:
+    """Mount ManualMatchScreen in a headless app and check the table contents."""
+
+    @staticmethod
+    async def _wait_for_rows(pilot, table, expected: int) -> None:
+        """Let the app run until the table holds expected rows (or give up)."""
+        for _ in range(500):
+            if table.row_count >= expected:
+                return
+            await pilot.pause()
+
+    def test_streams_rows_beyond_initial_window(self) -> None:
+        """Test that rows past INITIAL_ROWS are all added by the worker."""
+        from src.tui.manual_match_screen import ManualMatchScreen
+
+        source_df = TestDataFactory.create_source_dataframe()
+        target_df = _many_targets_dataframe(ManualMatchScreen.INITIAL_ROWS * 6 + 7)
+
+        async def run() -> tuple[int, list[str]]:
+            app = App()
+            async with app.run_test() as pilot:
+                screen = ManualMatchScreen(source_df, target_df, 0)
+                screen.show_all = True
+                await app.push_screen(screen)
+                table = screen.query_one("#targets_table")
+                await self._wait_for_rows(pilot, table, len(target_df))
+                await pilot.pause()
+                indices = [str(table.get_row_at(row)[0]) for row in range(table.row_count)]
+                return table.row_count, indices
+
+        row_count, indices = asyncio.run(run())
+
+        assert row_count == len(target_df)
+        assert indices == [str(idx) for idx in range(len(target_df))]
+
+    def test_similarity_column_matches_fuzz_ratio(self) -> None:
+        """Test the batched similarity scores are what the table displays."""
+        from rapidfuzz import fuzz
+
+        from src.tui.manual_match_screen import ManualMatchScreen
+
+        source_df = TestDataFactory.create_source_dataframe()
+        target_df = TestDataFactory.create_target_dataframe()
+
+        async def run() -> tuple[list[float], dict[str, str]]:
+            app = App()
+            async with app.run_test() as pilot:
+                screen = ManualMatchScreen(source_df, target_df, 0)
+                await app.push_screen(screen)
+                await pilot.pause()
+                table = screen.query_one("#targets_table")
+                shown = {
+                    str(table.get_row_at(row)[0]): str(table.get_row_at(row)[4])
+                    for row in range(table.row_count)
+                }
+                return screen._similarities.tolist(), shown
+
+        similarities, shown = asyncio.run(run())
+
+        source_desc = str(source_df.iloc[0]["description_clean"])
+        expected = [
+            fuzz.ratio(source_desc, str(desc)) / 100.0 for desc in target_df["description_clean"]
+        ]
+        assert similarities == expected
+        assert shown == {str(idx): f"{score:.0%}" for idx, score in enumerate(expected)}
+
+    def test_toggling_back_to_top_k_stops_streaming(self) -> None:
+        """Test that leaving the full list cancels its streaming worker."""
+        from src.tui.manual_match_screen import ManualMatchScreen
+
+        source_df = TestDataFactory.create_source_dataframe()
+        target_df = _many_targets_dataframe(ManualMatchScreen.ROW_BATCH * 20)
+
+        async def run() -> int:
+            app = App()
+            async with app.run_test() as pilot:
+                screen = ManualMatchScreen(source_df, target_df, 0)
+                await app.push_screen(screen)
+                table = screen.query_one("#targets_table")
+
+                # Into the full list, then straight back while it is streaming
+                screen.action_toggle_show_all()
+                screen.action_toggle_show_all()
+                for _ in range(50):
+                    await pilot.pause()
+                return table.row_count
+
+        assert asyncio.run(run()) == ManualMatchScreen.TOP_K
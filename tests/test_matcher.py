@@ -4,11 +4,21 @@ from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.aliases import AliasDatabase, seed_defaults
-from src.matcher import Match, MatchConfig, calculate_confidence, find_matches
+from src.matcher import (
+    Match,
+    MatchConfig,
+    _descending_order,
+    _greedy_assign,
+    _is_missing,
+    calculate_confidence,
+    calculate_confidence_batch,
+    find_matches,
+)
 
 
 class TestConfidenceCalculation:
@@ -106,6 +116,208 @@ class TestConfidenceCalculation:
         # Similar descriptions should still match well
         assert confidence > 0.9
 
+    def test_early_exit_threshold_skips_unreachable_pairs(self):
+        """Test that pairs which cannot reach the early-exit threshold score 0.0."""
+        source = pd.Series(
+            {
+                "date_clean": datetime(2024, 1, 15),
+                "amount_clean": Decimal("15.99"),
+                "description_clean": "netflix.com",
+            }
+        )
+        wrong_amount = pd.Series(
+            {
+                "date_clean": datetime(2024, 1, 15),
+                "amount_clean": Decimal("25.99"),
+                "description_clean": "netflix.com",
+            }
+        )
+        late = pd.Series(
+            {
+                "date_clean": datetime(2024, 1, 17),
+                "amount_clean": Decimal("15.99"),
+                "description_clean": "netflix.com",
+            }
+        )
+        config = MatchConfig(threshold=0.7, date_window_days=3)
+
+        # Amount mismatch caps the score at 0.7; the late date caps it at 0.8
+        assert calculate_confidence(source, wrong_amount, config, early_exit_threshold=0.9) == 0.0
+        assert calculate_confidence(source, late, config, early_exit_threshold=0.9) == 0.0
+
+        # Reachable pairs keep their exact score
+        for target in (wrong_amount, late):
+            full = calculate_confidence(source, target, config)
+            assert calculate_confidence(source, target, config, early_exit_threshold=full) == full
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            pd.NA,
+            pd.NaT,
+            float("nan"),
+            np.float32("nan"),
+            Decimal("NaN"),
+            np.datetime64("NaT"),
+            Decimal("15.99"),
+            0,
+            "",
+            "netflix",
+            pd.Timestamp("2024-01-15"),
+            datetime(2024, 1, 15),
+            np.datetime64("2024-01-15"),
+        ],
+    )
+    def test_missing_check_agrees_with_pandas(self, value):
+        """Test that the scalar missing-value check classifies like pd.isna."""
+        assert _is_missing(value) == pd.isna(value)
+
+    def test_record_types_score_identically(self):
+        """Series, dict and itertuples records give the same confidence."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("15.99"),
+                    "description_clean": "netflix.com",
+                }
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 16),
+                    "amount_clean": Decimal("15.99"),
+                    "description_clean": "netflix",
+                }
+            ]
+        )
+        config = MatchConfig()
+
+        expected = calculate_confidence(source_df.iloc[0], target_df.iloc[0], config)
+
+        assert (
+            calculate_confidence(
+                source_df.to_dict("records")[0], target_df.to_dict("records")[0], config
+            )
+            == expected
+        )
+        assert (
+            calculate_confidence(
+                next(source_df.itertuples(index=False)),
+                next(target_df.itertuples(index=False)),
+                config,
+            )
+            == expected
+        )
+
+
+class TestConfidenceBatch:
+    """Tests for calculate_confidence_batch."""
+
+    def test_batch_matches_pairwise_confidence(self, tmp_path: Path):
+        """Every matrix entry equals calculate_confidence for that pair."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("15.99"),
+                    "description_clean": "netflix.com",
+                },
+                {
+                    "date_clean": datetime(2024, 1, 18, 13, 0),
+                    "amount_clean": Decimal("1.10"),
+                    "description_clean": "whole foods market",
+                },
+                {
+                    "date_clean": pd.NaT,
+                    "amount_clean": None,
+                    "description_clean": None,
+                },
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 16),
+                    "amount_clean": Decimal("15.89"),
+                    "description_clean": "netflix",
+                },
+                {
+                    "date_clean": datetime(2024, 1, 17),
+                    "amount_clean": Decimal("1.00"),
+                    "description_clean": "whole foods",
+                },
+            ]
+        )
+        alias_db = AliasDatabase(tmp_path / "aliases.db")
+        alias_db.add_alias("Netflix", "netflix.com")
+        alias_db.add_alias("Netflix", "netflix")
+        config = MatchConfig(date_window_days=3)
+
+        matrix = calculate_confidence_batch(source_df, target_df, config, alias_db=alias_db)
+
+        assert matrix.shape == (3, 2)
+        for i in range(len(source_df)):
+            for j in range(len(target_df)):
+                expected = calculate_confidence(
+                    source_df.iloc[i], target_df.iloc[j], config, alias_db=alias_db
+                )
+                assert matrix[i, j] == expected
+        alias_db.close()
+
+    def test_batch_sub_cent_amounts_match_pairwise(self):
+        """Amounts finer than a cent fall back to exact Decimal comparison."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("10.005"),
+                    "description_clean": "fuel",
+                }
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("10.105"),
+                    "description_clean": "fuel",
+                },
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("10.106"),
+                    "description_clean": "fuel",
+                },
+            ]
+        )
+        config = MatchConfig()
+
+        matrix = calculate_confidence_batch(source_df, target_df, config)
+
+        assert list(matrix[0]) == [
+            calculate_confidence(source_df.iloc[0], target_df.iloc[j], config) for j in range(2)
+        ]
+        assert matrix[0, 0] > matrix[0, 1]
+
+    def test_batch_empty_target(self):
+        """An empty target frame yields an empty column dimension."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("15.99"),
+                    "description_clean": "netflix.com",
+                }
+            ]
+        )
+        target_df = source_df.iloc[0:0]
+
+        matrix = calculate_confidence_batch(source_df, target_df, MatchConfig())
+
+        assert matrix.shape == (1, 0)
+
 
 class TestDuplicatePrevention:
     """Tests for duplicate handling (Mitigation #1)."""
@@ -187,6 +399,43 @@ class TestDuplicatePrevention:
         assert result.matches[0].source_idx == 0
         assert result.matches[0].confidence > 0.95
 
+    def test_greedy_assign_across_blocks_matches_sequential_walk(self):
+        """Test that the blocked greedy walk picks what a plain sorted walk picks."""
+        rng = np.random.default_rng(7)
+        n_pairs = 20_000
+        confidence = rng.choice([0.3, 0.55, 0.7, 0.9, 1.0], size=n_pairs)
+        pair_source = rng.integers(0, 300, size=n_pairs)
+        pair_target = rng.integers(0, 250, size=n_pairs)
+
+        expected: list[int] = []
+        used_source: set[int] = set()
+        used_target: set[int] = set()
+        for candidate in sorted(range(n_pairs), key=lambda i: -confidence[i]):
+            source_idx, target_idx = int(pair_source[candidate]), int(pair_target[candidate])
+            if source_idx in used_source or target_idx in used_target:
+                continue
+            expected.append(candidate)
+            used_source.add(source_idx)
+            used_target.add(target_idx)
+
+        chosen, matched_source, matched_target = _greedy_assign(
+            confidence, pair_source, pair_target, 300, 250
+        )
+
+        assert chosen.tolist() == expected
+        assert set(np.flatnonzero(matched_source).tolist()) == used_source
+        assert set(np.flatnonzero(matched_target).tolist()) == used_target
+
+    def test_descending_order_is_stable_for_rounded_and_raw_scores(self):
+        """Test that both confidence orderings are a stable descending sort."""
+        rng = np.random.default_rng(11)
+        rounded = np.round(rng.choice([0.1, 0.5, 0.9], size=5_000) + rng.random(5_000) / 10, 4)
+        raw = rng.random(5_000)
+
+        for confidence in (rounded, raw):
+            expected = sorted(range(len(confidence)), key=lambda i: -confidence[i])
+            assert _descending_order(confidence).tolist() == expected
+
     def test_duplicate_transactions_match_one_to_one(self, tmp_path: Path):
         """Test that N identical sources and N identical targets all match 1:1."""
         # Multiple identical transactions (e.g. MTA rides) with alias resolution
@@ -223,9 +472,7 @@ class TestDuplicatePrevention:
         )
 
         config = MatchConfig()
-        result = find_matches(
-            source_df, target_df, config, min_confidence=0.1, alias_db=alias_db
-        )
+        result = find_matches(source_df, target_df, config, min_confidence=0.1, alias_db=alias_db)
 
         # All-pairs greedy: both sources should match both targets 1:1
         assert len(result.matches) == 2
@@ -253,6 +500,36 @@ class TestMatchResultStructure:
 
         assert match.target_idx is None
 
+    def test_missing_lists_report_unmatched_positions(self):
+        """Unmatched records are listed in ascending order on both sides."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal(amount),
+                    "description_clean": "Coffee Shop",
+                }
+                for amount in ("4.50", "99.00", "4.50")
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal(amount),
+                    "description_clean": "Coffee Shop",
+                }
+                for amount in ("12.00", "4.50", "7.25")
+            ]
+        )
+
+        result = find_matches(source_df, target_df, MatchConfig())
+
+        assert len(result.matches) == 1
+        assert result.matches[0].target_idx == 1
+        assert result.missing_in_target == sorted({0, 1, 2} - {result.matches[0].source_idx})
+        assert result.missing_in_source == [0, 2]
+
 
 class TestEndToEndMatching:
     """End-to-end tests for matching logic."""
@@ -310,6 +587,38 @@ class TestEndToEndMatching:
         for match in result.matches:
             assert match.confidence >= config.threshold
 
+    def test_find_matches_with_timezone_aware_dates(self):
+        """Test that tz-aware date columns match and score like the scalar path."""
+        source_df = pd.DataFrame(
+            {
+                "date_clean": pd.to_datetime(
+                    ["2024-01-15T23:30:00Z", "2024-01-20T08:00:00Z"], utc=True
+                ),
+                "amount_clean": [Decimal("15.99"), Decimal("42.87")],
+                "description_clean": ["netflix.com", "whole foods"],
+            }
+        )
+        target_df = pd.DataFrame(
+            {
+                "date_clean": pd.to_datetime(
+                    ["2024-01-16T01:00:00+02:00", "2024-01-18T09:00:00+02:00"], utc=True
+                ).tz_convert("Europe/Berlin"),
+                "amount_clean": [Decimal("15.99"), Decimal("42.87")],
+                "description_clean": ["netflix", "whole foods market"],
+            }
+        )
+
+        config = MatchConfig(threshold=0.7, date_window_days=3)
+        result = find_matches(source_df, target_df, config)
+
+        assert [(m.source_idx, m.target_idx) for m in result.matches] == [(0, 0), (1, 1)]
+        # Dates one day apart as instants, scored like the scalar path
+        assert result.matches[0].confidence == calculate_confidence(
+            source_df.iloc[0], target_df.iloc[0], config
+        )
+        # Same first two words and exact amount: intelligent match
+        assert result.matches[1].confidence == 0.90
+
 
 class TestConfidenceTierClassification:
     """Tests for 4-tier confidence categorization system."""
@@ -350,6 +659,18 @@ class TestConfidenceTierClassification:
         assert classify_confidence_tier(0.05) == ConfidenceTier.NONE
         assert classify_confidence_tier(0.09) == ConfidenceTier.NONE
 
+    def test_vectorized_tiers_match_scalar(self):
+        """Batch tier classification agrees with classify_confidence_tier."""
+        import numpy as np
+
+        from src.matcher import _classify_confidence_tiers, classify_confidence_tier
+
+        scores = np.array([0.0, 0.0999, 0.1, 0.4999, 0.5, 0.8999, 0.9, 1.0])
+
+        assert _classify_confidence_tiers(scores) == [
+            classify_confidence_tier(score) for score in scores.tolist()
+        ]
+
     def test_auto_accept_high_confidence(self):
         """Test that HIGH tier matches are auto-accepted."""
         from src.models import MatchDecision
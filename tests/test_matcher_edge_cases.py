@@ -176,6 +176,47 @@ class TestCalculateReason:
         # Should handle NaN gracefully
         assert reason is not None
 
+    def test_find_matches_reasons_agree_with_calculate_reason(self) -> None:
+        """Reasons attached by find_matches equal calculate_reason on the matched rows."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "amount_clean": Decimal("100.00"),
+                    "date_clean": datetime(2024, 1, 15, 23, 30),
+                    "description_clean": "coffee shop",
+                },
+                {
+                    "amount_clean": Decimal("42.50"),
+                    "date_clean": datetime(2024, 1, 20),
+                    "description_clean": None,
+                },
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "amount_clean": Decimal("42.50"),
+                    "date_clean": datetime(2024, 1, 18, 8, 0),
+                    "description_clean": "grocery store",
+                },
+                {
+                    "amount_clean": Decimal("101.00"),
+                    "date_clean": datetime(2024, 1, 16, 0, 15),
+                    "description_clean": "coffee shops",
+                },
+            ]
+        )
+
+        result = find_matches(source_df, target_df, MatchConfig())
+
+        assert len(result.matches) == 2
+        for match in result.matches:
+            assert match.target_idx is not None
+            expected = calculate_reason(
+                source_df.iloc[match.source_idx], target_df.iloc[match.target_idx]
+            )
+            assert match.reason == expected
+
 
 class TestFindMatchesEdgeCases:
     """Test find_matches edge cases."""
@@ -404,3 +445,59 @@ class TestFindMatchesEdgeCases:
 
         # All source records should be missing (no matches ≥ 0.9)
         assert len(result.missing_in_target) == len(source_df)
+
+    def test_amount_band_edges_are_inclusive(self) -> None:
+        """Targets exactly on the ±tolerance band edges remain candidates."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("100.00"),
+                    "description_clean": "transfer",
+                }
+            ]
+            * 2
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal(amount),
+                    "description_clean": "transfer",
+                }
+                for amount in ("89.99", "90.00", "110.00", "110.01")
+            ]
+        )
+
+        result = find_matches(source_df, target_df, MatchConfig())
+
+        assert sorted(m.target_idx for m in result.matches if m.target_idx is not None) == [1, 2]
+        assert result.missing_in_source == [0, 3]
+
+    def test_targets_between_source_bands_are_not_candidates(self) -> None:
+        """A target inside the global range but outside every source band never matches."""
+        source_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal(amount),
+                    "description_clean": "transfer",
+                }
+                for amount in ("100.00", "500.00")
+            ]
+        )
+        target_df = pd.DataFrame(
+            [
+                {
+                    "date_clean": datetime(2024, 1, 15),
+                    "amount_clean": Decimal("300.00"),
+                    "description_clean": "transfer",
+                }
+            ]
+        )
+
+        result = find_matches(source_df, target_df, MatchConfig())
+
+        assert result.matches == []
+        assert result.missing_in_target == [0, 1]
+        assert result.missing_in_source == [0]
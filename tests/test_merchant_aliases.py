@@ -36,6 +36,83 @@ class TestAliasDatabaseInitialization:
 
         assert db2 is not None
 
+    def test_instances_share_pooled_connection(self, tmp_path: Path) -> None:
+        """Test that instances on one file reuse a connection until the last closes."""
+        import sqlite3
+
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        db1 = AliasDatabase(db_path)
+        db2 = AliasDatabase(db_path)
+        assert db1.conn is db2.conn
+
+        db1.close()
+        db1.close()  # idempotent: must not release db2's reference
+        assert db2.list_aliases() == []
+
+        db2.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            db2.conn.execute("SELECT 1")
+
+        db3 = AliasDatabase(db_path)
+        assert db3.conn is not db2.conn
+        AliasDatabase.close_all()
+        with pytest.raises(sqlite3.ProgrammingError):
+            db3.conn.execute("SELECT 1")
+
+    def test_close_after_close_all_drops_buffered_usage(self, tmp_path: Path) -> None:
+        """Test that closing an instance whose pooled connection is gone does not raise."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+        db.add_alias("Netflix", "netflix.com")
+        assert db.get_primary_name("netflix.com") == "Netflix"  # buffers a usage count
+
+        AliasDatabase.close_all()
+        db.close()
+
+    def test_memory_databases_are_not_shared(self) -> None:
+        """Test that each :memory: instance gets its own database."""
+        from src.aliases import AliasDatabase
+
+        db1 = AliasDatabase(":memory:")
+        db2 = AliasDatabase(":memory:")
+        db1.add_alias("Netflix", "netflix.com")
+
+        assert db1.conn is not db2.conn
+        assert db2.get_primary_name("netflix.com") is None
+
+        db1.close()
+        assert db2.list_aliases() == []
+        db2.close()
+
+    def test_pooled_connection_usable_from_another_thread(self, tmp_path: Path) -> None:
+        """Test that a pooled connection can be used from a worker thread."""
+        import threading
+
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+        db.add_alias("Netflix", "netflix.com")
+        errors: list[Exception] = []
+
+        def lookup() -> None:
+            try:
+                other = AliasDatabase(tmp_path / "aliases.db")
+                other.add_alias("Spotify", "spotify ab")
+                other.close()
+            except Exception as exc:
+                errors.append(exc)
+
+        worker = threading.Thread(target=lookup)
+        worker.start()
+        worker.join()
+
+        assert errors == []
+        assert db.get_primary_name("spotify ab") == "Spotify"
+        db.close()
+
     def test_database_creates_aliases_table(self, tmp_path: Path) -> None:
         """Test that aliases table is created on initialization."""
         from src.aliases import AliasDatabase
@@ -49,6 +126,76 @@ class TestAliasDatabaseInitialization:
 
         assert "aliases" in table_names
 
+    def test_database_creates_usage_index(self, tmp_path: Path) -> None:
+        """Test that the usage_count index used by list_aliases exists."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+
+        indexes = db._execute_query("SELECT name FROM sqlite_master WHERE type='index'")
+        assert "idx_usage_desc" in [row[0] for row in indexes]
+
+    def test_database_migrates_legacy_table(self, tmp_path: Path) -> None:
+        """Test that databases with the old rowid-based schema keep their aliases."""
+        import sqlite3
+
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        legacy = sqlite3.connect(db_path)
+        legacy.execute("""
+            CREATE TABLE aliases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                primary_name TEXT NOT NULL,
+                alias TEXT NOT NULL UNIQUE,
+                created_at TEXT NOT NULL,
+                usage_count INTEGER DEFAULT 0
+            )
+        """)
+        legacy.execute(
+            "INSERT INTO aliases (primary_name, alias, created_at, usage_count) "
+            "VALUES ('Netflix', 'netflix.com', '2024-01-01T00:00:00', 5)"
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = AliasDatabase(db_path)
+
+        columns = [row["name"] for row in db._execute_query("PRAGMA table_info(aliases)")]
+        assert "id" not in columns
+        assert db.get_primary_name("netflix.com") == "Netflix"
+        assert db.list_aliases()[0].usage_count == 6
+
+    def test_database_migrates_table_without_created_at_default(self, tmp_path: Path) -> None:
+        """Test that a table whose created_at has no default is rebuilt."""
+        import sqlite3
+
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        older = sqlite3.connect(db_path)
+        older.execute("""
+            CREATE TABLE aliases (
+                alias TEXT PRIMARY KEY,
+                primary_name TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                usage_count INTEGER DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        older.execute(
+            "INSERT INTO aliases VALUES ('netflix.com', 'Netflix', '2024-01-01T00:00:00', 2)"
+        )
+        older.commit()
+        older.close()
+
+        db = AliasDatabase(db_path)
+        db.add_alias("AT&T", "att payment")
+
+        aliases = {a.alias: a for a in db.list_aliases()}
+        assert aliases["netflix.com"].created_at == datetime(2024, 1, 1)
+        assert aliases["netflix.com"].usage_count == 2
+        assert aliases["att payment"].created_at is not None
+
     def test_database_handles_invalid_path(self, tmp_path: Path) -> None:
         """Test that invalid database path is handled."""
         from src.aliases import AliasDatabase
@@ -152,6 +299,30 @@ class TestAliasAdd:
         aliases = db.list_aliases()
         assert aliases[0].usage_count == 0
 
+    def test_bulk_add_aliases(self, tmp_path: Path) -> None:
+        """Test that bulk_add_aliases normalizes and upserts every pair."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+        db.add_alias("Old Name", "netflix.com")
+
+        db.bulk_add_aliases([("Netflix", " NETFLIX.COM "), ("AT&T", "att payment")])
+
+        assert db.get_primary_name("netflix.com") == "Netflix"
+        assert db.get_primary_name("att payment") == "AT&T"
+        assert all(a.created_at is not None for a in db.list_aliases())
+
+    def test_bulk_add_aliases_rejects_invalid_pair(self, tmp_path: Path) -> None:
+        """Test that an invalid pair aborts the whole batch."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+
+        with pytest.raises(ValueError, match="Alias cannot be empty"):
+            db.bulk_add_aliases([("Netflix", "netflix.com"), ("AT&T", "  ")])
+
+        assert db.list_aliases() == []
+
 
 class TestAliasLookup:
     """Test looking up aliases in database."""
@@ -204,6 +375,18 @@ class TestAliasLookup:
         # Should find with whitespace
         assert db.get_primary_name("  netflix.com  ") == "Netflix"
 
+    def test_get_primary_names_bulk_lookup(self, tmp_path: Path) -> None:
+        """Test that bulk lookup matches single lookups, including usage counts."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+        db.add_alias("Netflix", "netflix.com")
+
+        results = db.get_primary_names([" NETFLIX.COM", "unknown", "netflix.com"])
+
+        assert results == ["Netflix", None, "Netflix"]
+        assert db.list_aliases()[0].usage_count == 2
+
     def test_get_primary_name_increments_usage(self, tmp_path: Path) -> None:
         """Test that lookup increments usage count."""
         from src.aliases import AliasDatabase
@@ -223,6 +406,38 @@ class TestAliasLookup:
         aliases = db.list_aliases()
         assert aliases[0].usage_count == 2
 
+    def test_usage_count_persisted_on_close(self, tmp_path: Path) -> None:
+        """Test that buffered usage increments are written when the database closes."""
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        db = AliasDatabase(db_path)
+        db.add_alias("Netflix", "netflix.com")
+
+        for _ in range(3):
+            db.get_primary_name("netflix.com")
+        db.close()
+
+        reopened = AliasDatabase(db_path)
+        assert reopened.list_aliases()[0].usage_count == 3
+
+    def test_lookup_cache_invalidated_on_write(self, tmp_path: Path) -> None:
+        """Test that cached lookups reflect later add/delete operations."""
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        db = AliasDatabase(db_path)
+
+        assert db.get_primary_name("netflix.com") is None
+        assert db.find_similar_aliases("netflix.com") == []
+
+        db.add_alias("Netflix", "netflix.com")
+        assert db.get_primary_name("netflix.com") == "Netflix"
+        assert db.find_similar_aliases("netflix.com") == ["netflix.com"]
+
+        db.delete_alias("netflix.com")
+        assert db.get_primary_name("netflix.com") is None
+
 
 class TestAliasList:
     """Test listing aliases from database."""
@@ -418,6 +633,47 @@ class TestAliasSimilaritySearch:
         # Most similar should be first
         assert results[0] == "netflix"
 
+    def test_batch_find_similar_matches_single_lookups(self, tmp_path: Path) -> None:
+        """Test that the batched search agrees with per-description searches."""
+        from src.aliases import AliasDatabase
+
+        db_path = tmp_path / "aliases.db"
+        db = AliasDatabase(db_path)
+
+        db.add_alias("Netflix", "netflix.com")
+        db.add_alias("Netflix", "netflix")
+        db.add_alias("Spotify", "spotify usa")
+
+        descriptions = ["netflix", "  SPOTIFY US ", "unrelated merchant", "NETFLIX"]
+        results = db.batch_find_similar(descriptions, threshold=0.5)
+
+        assert results == [db.find_similar_aliases(d, threshold=0.5) for d in descriptions]
+        assert results[2] == []
+        # Repeated descriptions get independent result lists
+        assert results[3] == results[0] and results[3] is not results[0]
+
+    def test_find_similar_aliases_keeps_score_equal_to_threshold(self, tmp_path: Path) -> None:
+        """Test that an alias scoring exactly the threshold is still returned."""
+        from rapidfuzz import fuzz
+
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+        db.add_alias("Netflix", "netflix.com")
+
+        threshold = fuzz.ratio("netflix", "netflix.com") / 100
+
+        assert db.find_similar_aliases("netflix", threshold=threshold) == ["netflix.com"]
+        assert db.batch_find_similar(["netflix"], threshold=threshold) == [["netflix.com"]]
+
+    def test_batch_find_similar_empty_database(self, tmp_path: Path) -> None:
+        """Test batched search against an empty database."""
+        from src.aliases import AliasDatabase
+
+        db = AliasDatabase(tmp_path / "aliases.db")
+
+        assert db.batch_find_similar(["netflix", "spotify"]) == [[], []]
+
 
 class TestAliasIntegrationWithMatcher:
     """Test alias integration with matching confidence calculation."""
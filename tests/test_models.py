@@ -58,6 +58,13 @@ class TestMatch:
         assert match.target_idx is None
         assert match.decision == MatchDecision.PENDING
 
+    def test_match_uses_slots(self) -> None:
+        """Test that Match stores only its declared fields."""
+        match = Match(source_idx=0, target_idx=1, confidence=0.5, reason="test")
+        assert not hasattr(match, "__dict__")
+        match.decision = MatchDecision.ACCEPTED
+        assert match.decision == MatchDecision.ACCEPTED
+
 
 class TestMatchResult:
     """Test the MatchResult dataclass."""
@@ -76,6 +76,18 @@ class TestDisplayUtils:
         result = display_utils.format_amount(None)
         assert result == "N/A"
 
+    def test_format_amount_cache_keeps_signed_zero(self) -> None:
+        """Test cached formatting still renders 0 and -0 differently."""
+        assert display_utils.format_amount(0.0) == "$0.00"
+        assert display_utils.format_amount(-0.0) == "$-0.00"
+        assert display_utils.format_amount(Decimal("0.00")) == "$0.00"
+
+    def test_format_date_cache_keeps_time_zone(self) -> None:
+        """Test cached formatting distinguishes equal instants in other zones."""
+        utc = pd.Timestamp("2024-01-15 23:00", tz="UTC")
+        assert display_utils.format_date(utc) == "2024-01-15"
+        assert display_utils.format_date(utc.tz_convert("Asia/Tokyo")) == "2024-01-16"
+
     def test_truncate_short_string(self) -> None:
         """Test truncation of string shorter than max length."""
         result = display_utils.truncate_string("hello", 30)